@@ -1,6 +1,6 @@
 from fastapi import APIRouter
 
-from app.api.api_v1.endpoints import interventions, satellite_data, intervention_impacts, optimization_results, data_sources, climate_data, ml_optimization
+from app.api.api_v1.endpoints import interventions, satellite_data, intervention_impacts, optimization_results, data_sources, climate_data
 
 api_router = APIRouter()
 
@@ -40,9 +40,3 @@ api_router.include_router(
     prefix="/climate-data",
     tags=["climate-data"]
 )
-
-api_router.include_router(
-    ml_optimization.router,
-    prefix="/ml-optimization",
-    tags=["ml-optimization"]
-) 
\ No newline at end of file
@@ -1,4 +1,5 @@
-from fastapi import APIRouter, Query, HTTPException
+from fastapi import APIRouter, Query
+from starlette.concurrency import run_in_threadpool
 from datetime import datetime
 from typing import Optional
 from app.services.nasa_merra2 import get_climate_data
@@ -6,89 +7,80 @@ from app.services.nasa_services import nasa_services
 
 router = APIRouter()
 
+# Coordinates are snapped to a 0.01° (~1 km) grid so near-identical requests share cache entries
+COORDINATE_PRECISION = 2
+
 @router.get("/")
-def climate_data(date: str = Query(None, description="Date in YYYY-MM-DD format, or omit for latest")):
+async def climate_data(date: str = Query(None, description="Date in YYYY-MM-DD format, or omit for latest")):
     """Get basic climate data using MERRA-2"""
     try:
         dt = datetime.strptime(date, "%Y-%m-%d") if date else None
-        data = get_climate_data(dt)
+        data = await run_in_threadpool(get_climate_data, dt)
         return {"success": True, "data": data}
     except Exception as e:
         return {"success": False, "error": str(e)}
 
 @router.get("/co2")
-def co2_data(
-    lat: float = Query(..., description="Latitude"),
-    lon: float = Query(..., description="Longitude"),
+async def co2_data(
+    lat: float = Query(..., description="Latitude (rounded to 0.01°)"),
+    lon: float = Query(..., description="Longitude (rounded to 0.01°)"),
     date: Optional[str] = Query(None, description="Date in YYYY-MM-DD format")
 ):
     """Get CO2 concentration data for a specific location"""
-    try:
-        data = nasa_services.get_co2_concentrations(lat, lon, date)
-        return {"success": True, "data": data}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    lat, lon = round(lat, COORDINATE_PRECISION), round(lon, COORDINATE_PRECISION)
+    data = await nasa_services.get_co2_concentrations(lat, lon, date)
+    return {"success": True, "data": data}
 
 @router.get("/temperature")
-def temperature_data(
-    lat: float = Query(..., description="Latitude"),
-    lon: float = Query(..., description="Longitude"),
+async def temperature_data(
+    lat: float = Query(..., description="Latitude (rounded to 0.01°)"),
+    lon: float = Query(..., description="Longitude (rounded to 0.01°)"),
     date: Optional[str] = Query(None, description="Date in YYYY-MM-DD format")
 ):
     """Get temperature data for a specific location"""
-    try:
-        data = nasa_services.get_temperature_data(lat, lon, date)
-        return {"success": True, "data": data}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    lat, lon = round(lat, COORDINATE_PRECISION), round(lon, COORDINATE_PRECISION)
+    data = await nasa_services.get_temperature_data(lat, lon, date)
+    return {"success": True, "data": data}
 
 @router.get("/biomass")
-def biomass_data(
-    lat: float = Query(..., description="Latitude"),
-    lon: float = Query(..., description="Longitude"),
+async def biomass_data(
+    lat: float = Query(..., description="Latitude (rounded to 0.01°)"),
+    lon: float = Query(..., description="Longitude (rounded to 0.01°)"),
     radius_km: float = Query(10, description="Radius in kilometers for analysis")
 ):
     """Get biomass data for intervention planning"""
-    try:
-        data = nasa_services.get_biomass_data(lat, lon, radius_km)
-        return {"success": True, "data": data}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    lat, lon = round(lat, COORDINATE_PRECISION), round(lon, COORDINATE_PRECISION)
+    data = await nasa_services.get_biomass_data(lat, lon, radius_km)
+    return {"success": True, "data": data}
 
 @router.get("/historical")
-def historical_climate_data(
-    lat: float = Query(..., description="Latitude"),
-    lon: float = Query(..., description="Longitude"),
+async def historical_climate_data(
+    lat: float = Query(..., description="Latitude (rounded to 0.01°)"),
+    lon: float = Query(..., description="Longitude (rounded to 0.01°)"),
     years_back: int = Query(10, description="Number of years of historical data")
 ):
     """Get historical climate patterns for algorithm training"""
-    try:
-        data = nasa_services.get_historical_climate_patterns(lat, lon, years_back)
-        return {"success": True, "data": data}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    lat, lon = round(lat, COORDINATE_PRECISION), round(lon, COORDINATE_PRECISION)
+    data = await nasa_services.get_historical_climate_patterns(lat, lon, years_back)
+    return {"success": True, "data": data}
 
 @router.get("/optimization")
-def intervention_optimization_data(
-    lat: float = Query(..., description="Latitude"),
-    lon: float = Query(..., description="Longitude")
+async def intervention_optimization_data(
+    lat: float = Query(..., description="Latitude (rounded to 0.01°)"),
+    lon: float = Query(..., description="Longitude (rounded to 0.01°)")
 ):
     """Get comprehensive data for climate intervention optimization"""
-    try:
-        data = nasa_services.get_intervention_optimization_data(lat, lon)
-        return {"success": True, "data": data}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    lat, lon = round(lat, COORDINATE_PRECISION), round(lon, COORDINATE_PRECISION)
+    data = await nasa_services.get_intervention_optimization_data(lat, lon)
+    return {"success": True, "data": data}
 
 @router.get("/satellite-imagery")
-def satellite_imagery(
-    lat: float = Query(..., description="Latitude"),
-    lon: float = Query(..., description="Longitude"),
+async def satellite_imagery(
+    lat: float = Query(..., description="Latitude (rounded to 0.01°)"),
+    lon: float = Query(..., description="Longitude (rounded to 0.01°)"),
     date: Optional[str] = Query(None, description="Date in YYYY-MM-DD format")
 ):
     """Get satellite imagery for visual analysis"""
-    try:
-        data = nasa_services.get_satellite_imagery(lat, lon, date)
-        return {"success": True, "data": data}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e)) 
\ No newline at end of file
+    lat, lon = round(lat, COORDINATE_PRECISION), round(lon, COORDINATE_PRECISION)
+    data = await nasa_services.get_satellite_imagery(lat, lon, date)
+    return {"success": True, "data": data} 
\ No newline at end of file
@@ -1,56 +1,90 @@
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
+import asyncio
+from typing import Annotated, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from datetime import datetime
 from uuid import UUID
+from app.api.deps import MAX_LOOKUP_IDS, PaginationParams, check_bulk_size, if_none_match, not_modified, weak_etag
+from app.core.response_cache import LIST_CACHE_TTL, STATS_CACHE_TTL, STATS_MAX_AGE, cache_response, invalidate_cache
+from app.crud import intervention_impact as crud
 from app.crud.intervention_impact import (
     create_intervention_impact,
+    create_intervention_impacts,
     get_intervention_impact_by_id,
+    get_intervention_impact_version,
     update_intervention_impact,
     delete_intervention_impact,
 )
-from app.schemas.intervention_impact import InterventionImpact
-
-# TODO: Refactor this endpoint for Supabase. All SQLAlchemy code removed.
+from app.schemas.intervention_impact import InterventionImpactCreate, EffectivenessRangeParams, InterventionImpactEnriched, InterventionImpactSummary
 
 router = APIRouter()
 
+# OpenAPI schema for list routes, which return PostgREST rows without re-validating them
+IMPACT_LIST_RESPONSES = {200: {"model": List[InterventionImpactSummary]}}
+ENRICHED_IMPACT_LIST_RESPONSES = {200: {"model": List[InterventionImpactEnriched]}}
+
 
 @router.post("/")
-def create(data: dict):
-    result = create_intervention_impact(data)
+async def create(data: dict):
+    result = await create_intervention_impact(data)
+    await invalidate_cache("impacts")
     if not result:
         raise HTTPException(status_code=400, detail="Insert failed")
     return result
 
 
+@router.post("/bulk", status_code=201)
+async def create_bulk(data: List[InterventionImpactCreate]):
+    check_bulk_size(data, "impacts")
+    result = await create_intervention_impacts(data)
+    await invalidate_cache("impacts")
+    return result
+
+
+@router.get("/by-ids/")
+async def read_many(ids: List[UUID] = Query(..., description="Repeat for each id, e.g. ?ids=a&ids=b")):
+    """Get several intervention impacts by id in one query, so clients need not fetch them one by one"""
+    check_bulk_size(ids, "impacts", MAX_LOOKUP_IDS)
+    return await crud.get_intervention_impacts_by_ids(ids)
+
+
 @router.get("/{id}")
-def read(id: str):
-    result = get_intervention_impact_by_id(id)
+async def read(id: UUID, request: Request, response: Response):
+    cached = if_none_match(request)
+    if cached:
+        version = await get_intervention_impact_version(str(id))
+        if version:
+            etag = weak_etag(version["id"], version["updated_at"])
+            if etag in cached:
+                return not_modified(etag)
+    result = await get_intervention_impact_by_id(str(id))
     if not result:
         raise HTTPException(status_code=404, detail="Not found")
+    response.headers["ETag"] = weak_etag(result["id"], result["updated_at"])
     return result
 
 
 @router.put("/{id}")
-def update(id: str, data: dict):
-    result = update_intervention_impact(id, data)
+async def update(id: UUID, data: dict):
+    result = await update_intervention_impact(str(id), data)
+    await invalidate_cache("impacts")
     if not result:
         raise HTTPException(status_code=400, detail="Update failed")
     return result
 
 
 @router.delete("/{id}")
-def delete(id: str):
-    result = delete_intervention_impact(id)
+async def delete(id: UUID):
+    result = await delete_intervention_impact(str(id))
+    await invalidate_cache("impacts")
     if not result:
         raise HTTPException(status_code=400, detail="Delete failed")
     return result
 
 
-@router.get("/", response_model=List[InterventionImpact])
-def get_intervention_impact_list(
-    skip: int = Query(0, ge=0),
-    limit: int = Query(100, ge=1, le=1000),
+@router.get("/", responses=IMPACT_LIST_RESPONSES)
+@cache_response("impacts", ttl=LIST_CACHE_TTL)
+async def get_intervention_impact_list(
+    pagination: PaginationParams = Depends(),
     intervention_id: Optional[UUID] = Query(None),
     grid_cell_id: Optional[UUID] = Query(None),
     start_time: Optional[datetime] = Query(None),
@@ -58,76 +92,99 @@ def get_intervention_impact_list(
     min_effectiveness: Optional[float] = Query(None, ge=0, le=1),
 ):
     """Get list of intervention impacts with optional filters"""
-    return crud.get_impact_list(
-        skip=skip,
-        limit=limit,
+    return pagination.page(await crud.get_impact_list(
+        skip=pagination.skip,
+        limit=pagination.limit,
         intervention_id=intervention_id,
         grid_cell_id=grid_cell_id,
         start_time=start_time,
         end_time=end_time,
-        min_effectiveness=min_effectiveness
-    )
+        min_effectiveness=min_effectiveness,
+        after=pagination.after
+    ), "timestamp")
+
+
+@router.get("/enriched/", responses=ENRICHED_IMPACT_LIST_RESPONSES)
+async def get_enriched_impact_list(
+    pagination: PaginationParams = Depends(),
+    intervention_id: Optional[UUID] = Query(None),
+    grid_cell_id: Optional[UUID] = Query(None),
+    start_time: Optional[datetime] = Query(None),
+    end_time: Optional[datetime] = Query(None),
+    min_effectiveness: Optional[float] = Query(None, ge=0, le=1),
+):
+    """
+    Get intervention impacts with their intervention's name, type and location.
+    Not response-cached: intervention writes would not invalidate the "impacts" namespace.
+    """
+    return pagination.page(await crud.get_enriched_impact_list(
+        skip=pagination.skip,
+        limit=pagination.limit,
+        intervention_id=intervention_id,
+        grid_cell_id=grid_cell_id,
+        start_time=start_time,
+        end_time=end_time,
+        min_effectiveness=min_effectiveness,
+        after=pagination.after
+    ), "timestamp")
 
 
-@router.get("/intervention/{intervention_id}", response_model=List[InterventionImpact])
-def get_impacts_by_intervention(
+@router.get("/intervention/{intervention_id}", responses=IMPACT_LIST_RESPONSES)
+async def get_impacts_by_intervention(
     intervention_id: UUID,
-    skip: int = Query(0, ge=0),
-    limit: int = Query(100, ge=1, le=1000),
+    pagination: PaginationParams = Depends(),
 ):
     """Get all impacts for a specific intervention"""
-    return crud.get_impacts_by_intervention(
+    return pagination.page(await crud.get_impacts_by_intervention(
         intervention_id=intervention_id,
-        skip=skip,
-        limit=limit
-    )
+        skip=pagination.skip,
+        limit=pagination.limit,
+        after=pagination.after
+    ), "timestamp")
 
 
-@router.get("/grid-cell/{grid_cell_id}", response_model=List[InterventionImpact])
-def get_impacts_by_grid_cell(
+@router.get("/grid-cell/{grid_cell_id}", responses=IMPACT_LIST_RESPONSES)
+async def get_impacts_by_grid_cell(
     grid_cell_id: UUID,
-    skip: int = Query(0, ge=0),
-    limit: int = Query(100, ge=1, le=1000),
+    pagination: PaginationParams = Depends(),
     start_time: Optional[datetime] = Query(None),
     end_time: Optional[datetime] = Query(None),
 ):
     """Get impacts for a specific grid cell"""
-    return crud.get_impacts_by_grid_cell(
+    return pagination.page(await crud.get_impacts_by_grid_cell(
         grid_cell_id=grid_cell_id,
-        skip=skip,
-        limit=limit,
+        skip=pagination.skip,
+        limit=pagination.limit,
         start_time=start_time,
-        end_time=end_time
-    )
+        end_time=end_time,
+        after=pagination.after
+    ), "timestamp")
 
 
-@router.get("/effectiveness-range/", response_model=List[InterventionImpact])
-def get_impacts_by_effectiveness_range(
-    min_effectiveness: float = Query(..., ge=0, le=1),
-    max_effectiveness: float = Query(..., ge=0, le=1),
-    skip: int = Query(0, ge=0),
-    limit: int = Query(100, ge=1, le=1000),
+@router.get("/effectiveness-range/", responses=IMPACT_LIST_RESPONSES)
+async def get_impacts_by_effectiveness_range(
+    effectiveness: Annotated[EffectivenessRangeParams, Query()],
+    pagination: PaginationParams = Depends(),
 ):
     """Get impacts within a specific effectiveness range"""
-    if min_effectiveness > max_effectiveness:
-        raise HTTPException(status_code=400, detail="min_effectiveness must be less than or equal to max_effectiveness")
-    
-    return crud.get_impacts_by_effectiveness_range(
-        min_effectiveness=min_effectiveness,
-        max_effectiveness=max_effectiveness,
-        skip=skip,
-        limit=limit
-    )
-
-
-@router.get("/best-performing/", response_model=List[InterventionImpact])
-def get_best_performing_impacts(
+    return pagination.page(await crud.get_impacts_by_effectiveness_range(
+        min_effectiveness=effectiveness.min_effectiveness,
+        max_effectiveness=effectiveness.max_effectiveness,
+        skip=pagination.skip,
+        limit=pagination.limit,
+        after=pagination.after
+    ), "effectiveness_score")
+
+
+@router.get("/best-performing/", responses=IMPACT_LIST_RESPONSES)
+@cache_response("impacts", ttl=LIST_CACHE_TTL)
+async def get_best_performing_impacts(
     limit: int = Query(10, ge=1, le=100),
     intervention_id: Optional[UUID] = Query(None),
     grid_cell_id: Optional[UUID] = Query(None),
 ):
     """Get the best performing impacts based on effectiveness score"""
-    return crud.get_best_performing_impacts(
+    return await crud.get_best_performing_impacts(
         limit=limit,
         intervention_id=intervention_id,
         grid_cell_id=grid_cell_id
@@ -135,16 +192,36 @@ def get_best_performing_impacts(
 
 
 @router.get("/statistics/")
-def get_impact_statistics(
+@cache_response("impacts", ttl=STATS_CACHE_TTL, max_age=STATS_MAX_AGE)
+async def get_impact_statistics(
     intervention_id: Optional[UUID] = Query(None),
     grid_cell_id: Optional[UUID] = Query(None),
     start_time: Optional[datetime] = Query(None),
     end_time: Optional[datetime] = Query(None),
 ):
     """Get statistics for intervention impacts"""
-    return crud.get_impact_statistics(
+    return await crud.get_impact_statistics(
         intervention_id=intervention_id,
         grid_cell_id=grid_cell_id,
         start_time=start_time,
         end_time=end_time
-    ) 
\ No newline at end of file
+    )
+
+
+@router.get("/overview/")
+@cache_response("impacts", ttl=LIST_CACHE_TTL)
+async def get_impact_overview(
+    intervention_id: Optional[UUID] = Query(None),
+    grid_cell_id: Optional[UUID] = Query(None),
+    limit: int = Query(10, ge=1, le=100),
+):
+    """
+    Latest impacts, statistics and best performers for a dashboard in one call.
+    The three reads are independent, so they run concurrently on the shared client.
+    """
+    latest, statistics, best_performing = await asyncio.gather(
+        crud.get_impact_list(limit=limit, intervention_id=intervention_id, grid_cell_id=grid_cell_id),
+        crud.get_impact_statistics(intervention_id=intervention_id, grid_cell_id=grid_cell_id),
+        crud.get_best_performing_impacts(limit=limit, intervention_id=intervention_id, grid_cell_id=grid_cell_id),
+    )
+    return {"latest": latest, "statistics": statistics, "best_performing": best_performing}
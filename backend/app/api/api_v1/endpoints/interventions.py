@@ -1,180 +1,255 @@
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from uuid import UUID
 
-from app.core.supabase_client import get_supabase
-from app.crud.intervention import (
-    create_intervention,
-    get_intervention_by_id,
-    update_intervention,
-    delete_intervention,
-    intervention
-)
+from app.api.deps import PaginationParams, check_bulk_size, if_none_match, not_modified, weak_etag
+from app.core.response_cache import STATS_CACHE_TTL, STATS_MAX_AGE, cache_response, invalidate_cache
+from app.core.supabase_client import get_async_supabase
+from app.crud.intervention import CountMode, intervention
 from app.schemas.intervention import (
     InterventionCreate,
     InterventionUpdate,
     InterventionResponse,
-    InterventionListResponse
+    InterventionListResponse,
+    InterventionSummary
 )
 
 router = APIRouter()
 
 
 @router.post("/", response_model=InterventionResponse, status_code=status.HTTP_201_CREATED)
-def create_intervention_endpoint(
+async def create_intervention_endpoint(
     *,
-    supabase=Depends(get_supabase),
+    supabase=Depends(get_async_supabase),
     intervention_in: InterventionCreate,
 ) -> InterventionResponse:
     """
     Create a new intervention.
     """
-    result = create_intervention(supabase=supabase, obj_in=intervention_in)
+    result = await intervention.create(supabase=supabase, obj_in=intervention_in)
+    await invalidate_cache("interventions")
     if not result:
         raise HTTPException(status_code=400, detail="Insert failed")
     return result
 
 
-@router.get("/", response_model=InterventionListResponse)
-def read_interventions(
-    supabase=Depends(get_supabase),
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
-    limit: int = Query(100, ge=1, le=1000, description="Number of records to return"),
+@router.post("/bulk", response_model=List[InterventionResponse], status_code=status.HTTP_201_CREATED)
+async def create_interventions_bulk(
+    *,
+    supabase=Depends(get_async_supabase),
+    interventions_in: List[InterventionCreate],
+) -> List[InterventionResponse]:
+    """
+    Create multiple interventions in one request.
+    """
+    check_bulk_size(interventions_in, "interventions")
+    result = await intervention.create_multi(supabase=supabase, objs_in=interventions_in)
+    await invalidate_cache("interventions")
+    return result
+
+
+@router.get("/", responses={200: {"model": InterventionListResponse}})
+async def read_interventions(
+    supabase=Depends(get_async_supabase),
+    pagination: PaginationParams = Depends(),
     intervention_type: Optional[str] = Query(None, description="Filter by intervention type"),
     operator_id: Optional[UUID] = Query(None, description="Filter by operator ID"),
     status: Optional[str] = Query(None, description="Filter by status"),
     search: Optional[str] = Query(None, description="Search in name, description, or operator"),
+    include_total: bool = Query(False, description="Count all matching interventions to fill in total and pages"),
+    count_mode: CountMode = Query("estimated", description="How total is counted: exact, planned, or estimated (exact up to the row limit)"),
 ) -> InterventionListResponse:
     """
     Retrieve interventions with optional filtering and pagination.
     """
-    interventions, total = intervention.get_multi(
+    interventions, total, has_more = await intervention.get_multi(
         supabase=supabase,
-        skip=skip,
-        limit=limit,
+        skip=pagination.skip,
+        limit=pagination.limit,
         intervention_type=intervention_type,
         operator_id=operator_id,
         status=status,
-        search=search
+        search=search,
+        after=pagination.after,
+        include_total=include_total,
+        count_mode=count_mode
     )
+    pagination.page(interventions, "created_at", has_more)
     
-    pages = (total + limit - 1) // limit if total > 0 else 0
-    page = (skip // limit) + 1 if total > 0 else 0
+    limit = pagination.limit
+    pages = None if total is None else (total + limit - 1) // limit
+    page = (pagination.skip // limit) + 1 if interventions or pagination.skip else 0
     
     return InterventionListResponse(
         interventions=interventions,
         total=total,
         page=page,
         size=limit,
-        pages=pages
+        pages=pages,
+        has_more=has_more,
+        next_cursor=pagination.next_cursor
+    )
+
+
+@router.get("/count")
+async def count_interventions(
+    supabase=Depends(get_async_supabase),
+    intervention_type: Optional[str] = Query(None, description="Filter by intervention type"),
+    operator_id: Optional[UUID] = Query(None, description="Filter by operator ID"),
+    status: Optional[str] = Query(None, description="Filter by status"),
+) -> dict:
+    """
+    Count interventions without returning them, e.g. to check whether any exist.
+    """
+    total = await intervention.count(
+        supabase=supabase,
+        intervention_type=intervention_type,
+        operator_id=operator_id,
+        status=status
     )
+    return {"count": total}
 
 
 @router.get("/{intervention_id}", response_model=InterventionResponse)
-def read_intervention(
+async def read_intervention(
     *,
-    supabase=Depends(get_supabase),
+    supabase=Depends(get_async_supabase),
     intervention_id: UUID,
+    request: Request,
+    response: Response,
 ) -> InterventionResponse:
     """
-    Get intervention by ID.
+    Get intervention by ID. Answers 304 when If-None-Match carries the current ETag.
     """
-    result = get_intervention_by_id(supabase=supabase, id=intervention_id)
+    cached = if_none_match(request)
+    if cached:
+        version = await intervention.get_version(supabase=supabase, id=intervention_id)
+        if version:
+            etag = weak_etag(version["id"], version["updated_at"])
+            if etag in cached:
+                return not_modified(etag)
+    result = await intervention.get(supabase=supabase, id=intervention_id)
     if not result:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Intervention not found"
         )
+    response.headers["ETag"] = weak_etag(result.id, result.updated_at)
     return result
 
 
 @router.put("/{intervention_id}", response_model=InterventionResponse)
-def update_intervention_endpoint(
+async def update_intervention_endpoint(
     *,
-    supabase=Depends(get_supabase),
+    supabase=Depends(get_async_supabase),
     intervention_id: UUID,
     intervention_in: InterventionUpdate,
 ) -> InterventionResponse:
     """
     Update an intervention.
     """
-    result = update_intervention(supabase=supabase, id=intervention_id, obj_in=intervention_in)
+    result = await intervention.update(supabase=supabase, id=intervention_id, obj_in=intervention_in)
+    await invalidate_cache("interventions")
     if not result:
         raise HTTPException(status_code=400, detail="Update failed")
     return result
 
 
 @router.delete("/{intervention_id}")
-def delete_intervention_endpoint(
+async def delete_intervention_endpoint(
     *,
-    supabase=Depends(get_supabase),
+    supabase=Depends(get_async_supabase),
     intervention_id: UUID,
 ) -> dict:
     """
     Delete an intervention.
     """
-    result = delete_intervention(supabase=supabase, id=intervention_id)
+    result = await intervention.delete(supabase=supabase, id=intervention_id)
+    await invalidate_cache("interventions")
     if not result:
         raise HTTPException(status_code=400, detail="Delete failed")
     return {"message": "Intervention deleted successfully"}
 
 
-@router.get("/operator/{operator_id}", response_model=List[InterventionResponse])
-def read_interventions_by_operator(
+@router.get("/operator/{operator_id}", response_model=List[InterventionSummary])
+async def read_interventions_by_operator(
     *,
-    supabase=Depends(get_supabase),
+    supabase=Depends(get_async_supabase),
     operator_id: UUID,
-) -> List[InterventionResponse]:
+    pagination: PaginationParams = Depends(),
+) -> List[InterventionSummary]:
     """
     Get all interventions by a specific operator.
     """
-    interventions = intervention.get_by_operator(supabase=supabase, operator_id=operator_id)
-    return interventions
+    interventions = await intervention.get_by_operator(
+        supabase=supabase,
+        operator_id=operator_id,
+        skip=pagination.skip,
+        limit=pagination.limit,
+        after=pagination.after
+    )
+    return pagination.page(interventions, "created_at")
 
 
-@router.get("/type/{intervention_type}", response_model=List[InterventionResponse])
-def read_interventions_by_type(
+@router.get("/type/{intervention_type}", response_model=List[InterventionSummary])
+async def read_interventions_by_type(
     *,
-    supabase=Depends(get_supabase),
+    supabase=Depends(get_async_supabase),
     intervention_type: str,
-) -> List[InterventionResponse]:
+    pagination: PaginationParams = Depends(),
+) -> List[InterventionSummary]:
     """
     Get all interventions of a specific type.
     """
-    interventions = intervention.get_by_type(supabase=supabase, intervention_type=intervention_type)
-    return interventions
+    interventions = await intervention.get_by_type(
+        supabase=supabase,
+        intervention_type=intervention_type,
+        skip=pagination.skip,
+        limit=pagination.limit,
+        after=pagination.after
+    )
+    return pagination.page(interventions, "created_at")
 
 
-@router.get("/status/{status}", response_model=List[InterventionResponse])
-def read_interventions_by_status(
+@router.get("/status/{status}", response_model=List[InterventionSummary])
+async def read_interventions_by_status(
     *,
-    supabase=Depends(get_supabase),
+    supabase=Depends(get_async_supabase),
     status: str,
-) -> List[InterventionResponse]:
+    pagination: PaginationParams = Depends(),
+) -> List[InterventionSummary]:
     """
     Get all interventions with a specific status.
     """
-    interventions = intervention.get_by_status(supabase=supabase, status=status)
-    return interventions
+    interventions = await intervention.get_by_status(
+        supabase=supabase,
+        status=status,
+        skip=pagination.skip,
+        limit=pagination.limit,
+        after=pagination.after
+    )
+    return pagination.page(interventions, "created_at")
 
 
 @router.get("/stats/total-scale")
-def get_total_scale(
-    supabase=Depends(get_supabase),
+@cache_response("interventions", ttl=STATS_CACHE_TTL, max_age=STATS_MAX_AGE)
+async def get_total_scale(
+    supabase=Depends(get_async_supabase),
 ) -> dict:
     """
     Get total scale amount across all interventions.
     """
-    total_scale = intervention.get_total_capacity(supabase=supabase)
+    total_scale = await intervention.get_total_capacity(supabase=supabase)
     return {"total_scale_amount": total_scale}
 
 
 @router.get("/stats/scale-by-type")
-def get_scale_by_type(
-    supabase=Depends(get_supabase),
+@cache_response("interventions", ttl=STATS_CACHE_TTL, max_age=STATS_MAX_AGE)
+async def get_scale_by_type(
+    supabase=Depends(get_async_supabase),
 ) -> List[dict]:
     """
     Get scale amount grouped by intervention type.
     """
-    scale_by_type = intervention.get_capacity_by_type(supabase=supabase)
+    scale_by_type = await intervention.get_capacity_by_type(supabase=supabase)
     return scale_by_type 
\ No newline at end of file
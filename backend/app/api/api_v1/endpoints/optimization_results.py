@@ -1,152 +1,190 @@
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from datetime import datetime
 from uuid import UUID
+from app.api.deps import MAX_LOOKUP_IDS, PaginationParams, check_bulk_size, if_none_match, not_modified, weak_etag
+from app.core.response_cache import LIST_CACHE_TTL, STATS_CACHE_TTL, STATS_MAX_AGE, cache_response, invalidate_cache
+from app.crud import optimization_result as crud
 from app.crud.optimization_result import (
     create_optimization_result,
+    create_optimization_results,
     get_optimization_result_by_id,
+    get_optimization_result_version,
     update_optimization_result,
     delete_optimization_result,
 )
-from app.schemas.optimization_result import OptimizationResult
-
-# TODO: Refactor this endpoint for Supabase. All SQLAlchemy code removed.
+from app.schemas.optimization_result import OptimizationResultCreate, OptimizationResultSummary
 
 router = APIRouter()
 
+# OpenAPI schema for list routes, which return PostgREST rows without re-validating them
+OPTIMIZATION_RESULT_LIST_RESPONSES = {200: {"model": List[OptimizationResultSummary]}}
+
 
 @router.post("/")
-def create(data: dict):
-    result = create_optimization_result(data)
+async def create(data: dict):
+    result = await create_optimization_result(data)
+    await invalidate_cache("optimization_results")
     if not result:
         raise HTTPException(status_code=400, detail="Insert failed")
     return result
 
 
+@router.post("/bulk", status_code=201)
+async def create_bulk(data: List[OptimizationResultCreate]):
+    check_bulk_size(data, "optimization results")
+    result = await create_optimization_results(data)
+    await invalidate_cache("optimization_results")
+    return result
+
+
+@router.get("/by-ids/")
+async def read_many(ids: List[UUID] = Query(..., description="Repeat for each id, e.g. ?ids=a&ids=b")):
+    """Get several optimization results by id in one query, so clients need not fetch them one by one"""
+    check_bulk_size(ids, "optimization results", MAX_LOOKUP_IDS)
+    return await crud.get_optimization_results_by_ids(ids)
+
+
 @router.get("/{id}")
-def read(id: str):
-    result = get_optimization_result_by_id(id)
+async def read(id: UUID, request: Request, response: Response):
+    cached = if_none_match(request)
+    current = None
+    if cached:
+        version = await get_optimization_result_version(str(id))
+        if version:
+            current = weak_etag(version["id"], version["updated_at"])
+            if current in cached:
+                return not_modified(current)
+    result = await get_optimization_result_by_id(str(id))
+    if cached and (result and weak_etag(result["id"], result["updated_at"])) != current:
+        # The per-worker memo predates a write another worker handled; don't serve it
+        get_optimization_result_by_id.cache_pop(str(id))
+        result = await get_optimization_result_by_id(str(id))
     if not result:
         raise HTTPException(status_code=404, detail="Not found")
+    response.headers["ETag"] = weak_etag(result["id"], result["updated_at"])
     return result
 
 
 @router.put("/{id}")
-def update(id: str, data: dict):
-    result = update_optimization_result(id, data)
+async def update(id: UUID, data: dict):
+    result = await update_optimization_result(str(id), data)
+    await invalidate_cache("optimization_results")
     if not result:
         raise HTTPException(status_code=400, detail="Update failed")
     return result
 
 
 @router.delete("/{id}")
-def delete(id: str):
-    result = delete_optimization_result(id)
+async def delete(id: UUID):
+    result = await delete_optimization_result(str(id))
+    await invalidate_cache("optimization_results")
     if not result:
         raise HTTPException(status_code=400, detail="Delete failed")
     return result
 
 
-@router.get("/", response_model=List[OptimizationResult])
-def get_optimization_result_list(
-    skip: int = Query(0, ge=0),
-    limit: int = Query(100, ge=1, le=1000),
-    operator_id: Optional[UUID] = Query(None),
-    grid_cell_id: Optional[UUID] = Query(None),
-    optimization_type: Optional[str] = Query(None),
-    algorithm: Optional[str] = Query(None),
-    status: Optional[str] = Query(None),
+@router.get("/", responses=OPTIMIZATION_RESULT_LIST_RESPONSES)
+async def get_optimization_result_list(
+    pagination: PaginationParams = Depends(),
+    operator_id: Optional[List[UUID]] = Query(None, description="Repeat to match any of several operators"),
+    grid_cell_id: Optional[List[UUID]] = Query(None, description="Repeat to match any of several grid cells"),
+    optimization_type: Optional[List[str]] = Query(None),
+    algorithm: Optional[List[str]] = Query(None),
+    status: Optional[List[str]] = Query(None),
 ):
-    """Get list of optimization results with optional filters"""
-    return crud.get_optimization_result_list(
-        skip=skip,
-        limit=limit,
-        operator_id=operator_id,
-        grid_cell_id=grid_cell_id,
-        optimization_type=optimization_type,
-        algorithm=algorithm,
-        status=status
-    )
-
-
-@router.get("/operator/{operator_id}", response_model=List[OptimizationResult])
-def get_optimization_results_by_operator(
+    """Get list of optimization results with optional filters; repeated values are OR-ed"""
+    return pagination.page(await crud.get_optimization_result_list(
+        skip=pagination.skip,
+        limit=pagination.limit,
+        operator_ids=operator_id,
+        grid_cell_ids=grid_cell_id,
+        optimization_types=optimization_type,
+        algorithms=algorithm,
+        statuses=status,
+        after=pagination.after
+    ), "timestamp")
+
+
+@router.get("/operator/{operator_id}", responses=OPTIMIZATION_RESULT_LIST_RESPONSES)
+async def get_optimization_results_by_operator(
     operator_id: UUID,
-    skip: int = Query(0, ge=0),
-    limit: int = Query(100, ge=1, le=1000),
+    pagination: PaginationParams = Depends(),
 ):
     """Get all optimization results for a specific operator"""
-    return crud.get_optimization_results_by_operator(
-        operator_id=operator_id,
-        skip=skip,
-        limit=limit
-    )
+    return pagination.page(await crud.get_optimization_result_list(
+        operator_ids=[operator_id],
+        skip=pagination.skip,
+        limit=pagination.limit,
+        after=pagination.after
+    ), "timestamp")
 
 
-@router.get("/grid-cell/{grid_cell_id}", response_model=List[OptimizationResult])
-def get_optimization_results_by_grid_cell(
+@router.get("/grid-cell/{grid_cell_id}", responses=OPTIMIZATION_RESULT_LIST_RESPONSES)
+async def get_optimization_results_by_grid_cell(
     grid_cell_id: UUID,
-    skip: int = Query(0, ge=0),
-    limit: int = Query(100, ge=1, le=1000),
+    pagination: PaginationParams = Depends(),
 ):
     """Get optimization results for a specific grid cell"""
-    return crud.get_optimization_results_by_grid_cell(
-        grid_cell_id=grid_cell_id,
-        skip=skip,
-        limit=limit
-    )
+    return pagination.page(await crud.get_optimization_result_list(
+        grid_cell_ids=[grid_cell_id],
+        skip=pagination.skip,
+        limit=pagination.limit,
+        after=pagination.after
+    ), "timestamp")
 
 
-@router.get("/type/{optimization_type}", response_model=List[OptimizationResult])
-def get_optimization_results_by_type(
+@router.get("/type/{optimization_type}", responses=OPTIMIZATION_RESULT_LIST_RESPONSES)
+async def get_optimization_results_by_type(
     optimization_type: str,
-    skip: int = Query(0, ge=0),
-    limit: int = Query(100, ge=1, le=1000),
+    pagination: PaginationParams = Depends(),
 ):
     """Get optimization results by type"""
-    return crud.get_optimization_results_by_type(
-        optimization_type=optimization_type,
-        skip=skip,
-        limit=limit
-    )
+    return pagination.page(await crud.get_optimization_result_list(
+        optimization_types=[optimization_type],
+        skip=pagination.skip,
+        limit=pagination.limit,
+        after=pagination.after
+    ), "timestamp")
 
 
-@router.get("/algorithm/{algorithm}", response_model=List[OptimizationResult])
-def get_optimization_results_by_algorithm(
+@router.get("/algorithm/{algorithm}", responses=OPTIMIZATION_RESULT_LIST_RESPONSES)
+async def get_optimization_results_by_algorithm(
     algorithm: str,
-    skip: int = Query(0, ge=0),
-    limit: int = Query(100, ge=1, le=1000),
+    pagination: PaginationParams = Depends(),
 ):
     """Get optimization results by algorithm"""
-    return crud.get_optimization_results_by_algorithm(
-        algorithm=algorithm,
-        skip=skip,
-        limit=limit
-    )
+    return pagination.page(await crud.get_optimization_result_list(
+        algorithms=[algorithm],
+        skip=pagination.skip,
+        limit=pagination.limit,
+        after=pagination.after
+    ), "timestamp")
 
 
-@router.get("/status/{status}", response_model=List[OptimizationResult])
-def get_optimization_results_by_status(
+@router.get("/status/{status}", responses=OPTIMIZATION_RESULT_LIST_RESPONSES)
+async def get_optimization_results_by_status(
     status: str,
-    skip: int = Query(0, ge=0),
-    limit: int = Query(100, ge=1, le=1000),
+    pagination: PaginationParams = Depends(),
 ):
     """Get optimization results by status"""
-    return crud.get_optimization_results_by_status(
-        status=status,
-        skip=skip,
-        limit=limit
-    )
+    return pagination.page(await crud.get_optimization_result_list(
+        statuses=[status],
+        skip=pagination.skip,
+        limit=pagination.limit,
+        after=pagination.after
+    ), "timestamp")
 
 
-@router.get("/best-performing/", response_model=List[OptimizationResult])
-def get_best_optimization_results(
+@router.get("/best-performing/", responses=OPTIMIZATION_RESULT_LIST_RESPONSES)
+@cache_response("optimization_results", ttl=LIST_CACHE_TTL)
+async def get_best_optimization_results(
     limit: int = Query(10, ge=1, le=100),
     optimization_type: Optional[str] = Query(None),
     grid_cell_id: Optional[UUID] = Query(None),
 ):
     """Get the best optimization results based on objective value"""
-    return crud.get_best_optimization_results(
+    return await crud.get_best_optimization_results(
         limit=limit,
         optimization_type=optimization_type,
         grid_cell_id=grid_cell_id
@@ -154,14 +192,15 @@ def get_best_optimization_results(
 
 
 @router.get("/statistics/")
-def get_optimization_statistics(
+@cache_response("optimization_results", ttl=STATS_CACHE_TTL, max_age=STATS_MAX_AGE)
+async def get_optimization_statistics(
     operator_id: Optional[UUID] = Query(None),
     grid_cell_id: Optional[UUID] = Query(None),
     optimization_type: Optional[str] = Query(None),
     algorithm: Optional[str] = Query(None),
 ):
     """Get statistics for optimization results"""
-    return crud.get_optimization_statistics(
+    return await crud.get_optimization_statistics(
         operator_id=operator_id,
         grid_cell_id=grid_cell_id,
         optimization_type=optimization_type,
@@ -2,139 +2,183 @@ from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
 from datetime import datetime
 from uuid import UUID
+from app.api.deps import MAX_LOOKUP_IDS, PaginationParams, check_bulk_size
+from app.core.response_cache import LATEST_CACHE_TTL, LIST_CACHE_TTL, STATS_CACHE_TTL, STATS_MAX_AGE, cache_response, invalidate_cache
+from app.crud import satellite_data as crud
 from app.crud.satellite_data import (
     create_satellite_data,
+    create_satellite_data_bulk,
     get_satellite_data_by_id,
     update_satellite_data,
     delete_satellite_data,
 )
-from app.schemas.satellite_data import SatelliteData
-
-# TODO: Refactor this endpoint for Supabase. All SQLAlchemy code removed.
+from app.schemas.satellite_data import SatelliteData, SatelliteDataCreate, SatelliteDataSummary
 
 router = APIRouter()
 
+# OpenAPI schema for list routes, which return PostgREST rows without re-validating them
+SATELLITE_DATA_LIST_RESPONSES = {200: {"model": List[SatelliteDataSummary]}}
+
 
 @router.post("/")
-def create(data: dict):
-    result = create_satellite_data(data)
+async def create(data: dict):
+    result = await create_satellite_data(data)
+    await invalidate_cache("satellite_data")
     if not result:
         raise HTTPException(status_code=400, detail="Insert failed")
     return result
 
 
+@router.post("/bulk", status_code=201)
+async def create_bulk(
+    data: List[SatelliteDataCreate],
+    return_rows: bool = Query(True, description="Set to false to get only a count back instead of the inserted rows"),
+):
+    check_bulk_size(data, "satellite readings")
+    result = await create_satellite_data_bulk(data, return_rows=return_rows)
+    await invalidate_cache("satellite_data")
+    if not return_rows:
+        return {"inserted": len(data)}
+    return result
+
+
+@router.get("/by-ids/")
+async def read_many(ids: List[UUID] = Query(..., description="Repeat for each id, e.g. ?ids=a&ids=b")):
+    """Get several satellite readings by id in one query, so clients need not fetch them one by one"""
+    check_bulk_size(ids, "satellite readings", MAX_LOOKUP_IDS)
+    return await crud.get_satellite_data_by_ids(ids)
+
+
 @router.get("/{id}")
-def read(id: str):
-    result = get_satellite_data_by_id(id)
+async def read(id: UUID):
+    result = await get_satellite_data_by_id(str(id))
     if not result:
         raise HTTPException(status_code=404, detail="Not found")
     return result
 
 
 @router.put("/{id}")
-def update(id: str, data: dict):
-    result = update_satellite_data(id, data)
+async def update(id: UUID, data: dict):
+    result = await update_satellite_data(str(id), data)
+    await invalidate_cache("satellite_data")
     if not result:
         raise HTTPException(status_code=400, detail="Update failed")
     return result
 
 
 @router.delete("/{id}")
-def delete(id: str):
-    result = delete_satellite_data(id)
+async def delete(id: UUID):
+    result = await delete_satellite_data(str(id))
+    await invalidate_cache("satellite_data")
     if not result:
         raise HTTPException(status_code=400, detail="Delete failed")
     return result
 
 
-@router.get("/", response_model=List[SatelliteData])
-def get_satellite_data_list(
-    skip: int = Query(0, ge=0),
-    limit: int = Query(100, ge=1, le=1000),
+@router.get("/", responses=SATELLITE_DATA_LIST_RESPONSES)
+async def get_satellite_data_list(
+    pagination: PaginationParams = Depends(),
     grid_cell_id: Optional[UUID] = Query(None),
     satellite_id: Optional[str] = Query(None),
     start_time: Optional[datetime] = Query(None),
     end_time: Optional[datetime] = Query(None),
 ):
     """Get list of satellite data with optional filters"""
-    return crud.get_satellite_data_list(
-        skip=skip,
-        limit=limit,
+    return pagination.page(await crud.get_satellite_data_list(
+        skip=pagination.skip,
+        limit=pagination.limit,
         grid_cell_id=grid_cell_id,
         satellite_id=satellite_id,
         start_time=start_time,
-        end_time=end_time
-    )
+        end_time=end_time,
+        after=pagination.after
+    ), "timestamp")
 
 
-@router.get("/grid-cell/{grid_cell_id}", response_model=List[SatelliteData])
-def get_satellite_data_by_grid_cell(
+@router.get("/grid-cell/{grid_cell_id}", responses=SATELLITE_DATA_LIST_RESPONSES)
+@cache_response("satellite_data", ttl=LIST_CACHE_TTL)
+async def get_satellite_data_by_grid_cell(
     grid_cell_id: UUID,
-    skip: int = Query(0, ge=0),
-    limit: int = Query(100, ge=1, le=1000),
+    pagination: PaginationParams = Depends(),
     start_time: Optional[datetime] = Query(None),
     end_time: Optional[datetime] = Query(None),
 ):
     """Get satellite data for a specific grid cell"""
-    return crud.get_satellite_data_by_grid_cell(
+    return pagination.page(await crud.get_satellite_data_by_grid_cell(
         grid_cell_id=grid_cell_id,
-        skip=skip,
-        limit=limit,
+        skip=pagination.skip,
+        limit=pagination.limit,
         start_time=start_time,
-        end_time=end_time
-    )
+        end_time=end_time,
+        after=pagination.after
+    ), "timestamp")
 
 
-@router.get("/satellite/{satellite_id}", response_model=List[SatelliteData])
-def get_satellite_data_by_satellite(
+@router.get("/satellite/{satellite_id}", responses=SATELLITE_DATA_LIST_RESPONSES)
+async def get_satellite_data_by_satellite(
     satellite_id: str,
-    skip: int = Query(0, ge=0),
-    limit: int = Query(100, ge=1, le=1000),
+    pagination: PaginationParams = Depends(),
 ):
     """Get satellite data by satellite ID"""
-    return crud.get_satellite_data_by_satellite(
+    return pagination.page(await crud.get_satellite_data_by_satellite(
         satellite_id=satellite_id,
-        skip=skip,
-        limit=limit
-    )
+        skip=pagination.skip,
+        limit=pagination.limit,
+        after=pagination.after
+    ), "timestamp")
 
 
-@router.get("/time-range/", response_model=List[SatelliteData])
-def get_satellite_data_by_time_range(
+@router.get("/time-range/", responses=SATELLITE_DATA_LIST_RESPONSES)
+async def get_satellite_data_by_time_range(
     start_time: datetime = Query(...),
     end_time: datetime = Query(...),
-    skip: int = Query(0, ge=0),
-    limit: int = Query(100, ge=1, le=1000),
+    pagination: PaginationParams = Depends(),
 ):
     """Get satellite data within a time range"""
-    return crud.get_satellite_data_by_time_range(
+    return pagination.page(await crud.get_satellite_data_by_time_range(
         start_time=start_time,
         end_time=end_time,
-        skip=skip,
-        limit=limit
-    )
+        skip=pagination.skip,
+        limit=pagination.limit,
+        after=pagination.after
+    ), "timestamp")
 
 
 @router.get("/grid-cell/{grid_cell_id}/latest", response_model=SatelliteData)
-def get_latest_satellite_data_by_grid_cell(
+@cache_response("satellite_data", ttl=LATEST_CACHE_TTL)
+async def get_latest_satellite_data_by_grid_cell(
     grid_cell_id: UUID,
 ):
     """Get the latest satellite data for a grid cell"""
-    db_satellite_data = crud.get_latest_satellite_data_by_grid_cell(grid_cell_id=grid_cell_id)
+    db_satellite_data = await crud.get_latest_satellite_data_by_grid_cell(grid_cell_id=grid_cell_id)
     if db_satellite_data is None:
         raise HTTPException(status_code=404, detail="No satellite data found for this grid cell")
     return db_satellite_data
 
 
+@router.get("/latest-per-grid-cell/", responses=SATELLITE_DATA_LIST_RESPONSES)
+@cache_response("satellite_data", ttl=LATEST_CACHE_TTL)
+async def get_latest_satellite_data_per_grid_cell(
+    pagination: PaginationParams = Depends(),
+):
+    """Get the latest satellite data of every grid cell"""
+    return pagination.page(await crud.get_latest_satellite_data_per_grid_cell(
+        skip=pagination.skip,
+        limit=pagination.limit,
+        after=pagination.after
+    ), "grid_cell_id")
+
+
 @router.get("/statistics/")
-def get_satellite_data_statistics(
+@cache_response("satellite_data", ttl=STATS_CACHE_TTL, max_age=STATS_MAX_AGE)
+async def get_satellite_data_statistics(
     grid_cell_id: Optional[UUID] = Query(None),
     satellite_id: Optional[str] = Query(None),
     start_time: Optional[datetime] = Query(None),
     end_time: Optional[datetime] = Query(None),
 ):
     """Get statistics for satellite data"""
-    return crud.get_satellite_data_statistics(
+    return await crud.get_satellite_data_statistics(
         grid_cell_id=grid_cell_id,
         satellite_id=satellite_id,
         start_time=start_time,
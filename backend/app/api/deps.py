@@ -0,0 +1,71 @@
+from datetime import datetime
+from typing import Any, List, Optional, Union
+
+from fastapi import HTTPException, Query, Request, Response
+
+from app.core.pagination import decode_cursor, next_cursor
+
+# A bulk request is inserted as one statement; larger batches should be split by the client
+MAX_BULK_ROWS = 1000
+
+# Lookup ids travel in the query string twice (to the API, then to PostgREST), so keep URLs short
+MAX_LOOKUP_IDS = 100
+
+
+class PaginationParams:
+    """Shared skip/limit/cursor query parameters for list endpoints"""
+
+    def __init__(
+        self,
+        response: Response,
+        skip: int = Query(0, ge=0, description="Number of records to skip"),
+        limit: int = Query(100, ge=1, le=1000, description="Number of records to return"),
+        cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header; takes precedence over skip"),
+    ):
+        self.response = response
+        self.skip = skip
+        self.limit = limit
+        self.after = None
+        self.next_cursor = None
+        if cursor:
+            try:
+                self.after = decode_cursor(cursor)
+            except ValueError:
+                raise HTTPException(status_code=400, detail="Invalid cursor")
+            self.skip = 0
+
+    def page(self, rows: List[Any], sort_column: str, has_more: Optional[bool] = None) -> List[Any]:
+        """
+        Advertise the next page's cursor in X-Next-Cursor and return the rows unchanged.
+        Pass has_more when the query probed past the page, so a full last page gets no cursor.
+        """
+        self.next_cursor = None if has_more is False else next_cursor(rows, sort_column, self.limit)
+        if self.next_cursor:
+            self.response.headers["X-Next-Cursor"] = self.next_cursor
+        return rows
+
+
+def weak_etag(id: Any, updated_at: Union[str, datetime]) -> str:
+    """Weak ETag for a row version; PostgREST strings and parsed datetimes give the same tag"""
+    if isinstance(updated_at, str):
+        updated_at = datetime.fromisoformat(updated_at)
+    return f'W/"{id}-{updated_at.timestamp():.6f}"'
+
+
+def if_none_match(request: Request) -> List[str]:
+    """ETags the client already holds, from the If-None-Match header"""
+    header = request.headers.get("if-none-match")
+    return [tag.strip() for tag in header.split(",")] if header else []
+
+
+def not_modified(etag: str) -> Response:
+    """Empty 304 telling the client its cached copy is current"""
+    return Response(status_code=304, headers={"ETag": etag})
+
+
+def check_bulk_size(rows: List[Any], label: str, max_rows: int = MAX_BULK_ROWS) -> None:
+    """Reject bulk payloads that are empty or larger than max_rows"""
+    if not rows:
+        raise HTTPException(status_code=400, detail=f"No {label} provided")
+    if len(rows) > max_rows:
+        raise HTTPException(status_code=400, detail=f"At most {max_rows} {label} per request")
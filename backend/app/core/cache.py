@@ -0,0 +1,109 @@
+import asyncio
+import functools
+import inspect
+import threading
+
+from cachetools import TTLCache
+from cachetools.keys import hashkey
+
+
+def ttl_cache(ttl: float, maxsize: int = 4096):
+    """
+    Cache a function's results in-process for `ttl` seconds, keyed on its arguments.
+    Works for both plain and async functions; for coroutines the awaited value is cached
+    and concurrent misses on the same key share a single in-flight call.
+    Results carrying an "error" key are not cached so upstream failures get retried,
+    and neither is None, so a row looked up before it exists is found once created.
+    cache_pop/cache_clear also discard fills already in flight, so a value read before a
+    write is never stored after it.
+    """
+    def decorator(func):
+        cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        lock = threading.Lock()
+        missing = object()
+        # Fills in progress per key, and those a cache_pop/cache_clear overtook: a fill that
+        # read the row before a write must not store it after the write evicted the key
+        pending = {}
+        stale = set()
+        in_flight = {}
+
+        def lookup(key):
+            with lock:
+                return cache.get(key, missing)
+
+        def begin(key):
+            token = object()
+            with lock:
+                pending.setdefault(key, set()).add(token)
+            return token
+
+        def finish(key, token, result):
+            with lock:
+                tokens = pending[key]
+                tokens.discard(token)
+                if not tokens:
+                    del pending[key]
+                if token in stale:
+                    stale.discard(token)
+                    return
+                if result is not missing and result is not None and not (isinstance(result, dict) and "error" in result):
+                    cache[key] = result
+
+        if inspect.iscoroutinefunction(func):
+            async def fill(key, args, kwargs):
+                token = begin(key)
+                result = missing
+                try:
+                    result = await func(*args, **kwargs)
+                    return result
+                finally:
+                    finish(key, token, result)
+                    if in_flight.get(key) is asyncio.current_task():
+                        del in_flight[key]
+
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                key = hashkey(*args, **kwargs)
+                result = lookup(key)
+                if result is not missing:
+                    return result
+                task = in_flight.get(key)
+                if task is None:
+                    task = asyncio.ensure_future(fill(key, args, kwargs))
+                    in_flight[key] = task
+                return await asyncio.shield(task)
+        else:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                key = hashkey(*args, **kwargs)
+                result = lookup(key)
+                if result is missing:
+                    token = begin(key)
+                    try:
+                        result = func(*args, **kwargs)
+                    finally:
+                        finish(key, token, result)
+                return result
+
+        def cache_clear():
+            with lock:
+                cache.clear()
+                for tokens in pending.values():
+                    stale.update(tokens)
+            in_flight.clear()
+
+        def cache_pop(*args, **kwargs):
+            """Drop the entry for one call; pass the arguments the same way the callers do"""
+            key = hashkey(*args, **kwargs)
+            with lock:
+                cache.pop(key, None)
+                stale.update(pending.get(key, ()))
+            # Later callers start a fresh fill instead of joining one that may predate the write
+            in_flight.pop(key, None)
+
+        wrapper.cache = cache
+        wrapper.cache_clear = cache_clear
+        wrapper.cache_pop = cache_pop
+        return wrapper
+
+    return decorator
@@ -0,0 +1,124 @@
+import logging
+import os
+import time
+import uuid
+
+from fastapi.responses import ORJSONResponse
+from redis.exceptions import RedisError
+
+from app.core.redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "inflight"
+
+# In-flight requests allowed per client address; 0 (the default) turns the cap off.
+# Behind a load balancer or reverse proxy every request arrives from the proxy's
+# address, so only enable this with TRUSTED_PROXIES set, or the cap becomes global.
+MAX_CONCURRENT_REQUESTS = int(os.getenv("MAX_CONCURRENT_REQUESTS", "0"))
+
+# Comma-separated addresses of proxies whose X-Forwarded-For is trusted
+TRUSTED_PROXIES = frozenset(ip.strip() for ip in os.getenv("TRUSTED_PROXIES", "").split(",") if ip.strip())
+
+# After a Redis error, admit requests without asking Redis for this many seconds, so an
+# outage does not add the socket timeout to every request
+REDIS_BACKOFF = 5
+
+# Entries older than this are treated as leaked by a crashed worker and no longer count
+STALE_AFTER = 60
+
+# Atomically drop stale entries, check the count and admit the request
+ACQUIRE_SCRIPT = """
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', tonumber(ARGV[1]) - tonumber(ARGV[2]))
+if redis.call('ZCARD', KEYS[1]) >= tonumber(ARGV[3]) then
+    return 0
+end
+redis.call('ZADD', KEYS[1], ARGV[1], ARGV[4])
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+return 1
+"""
+
+
+def client_address(scope) -> str:
+    """
+    Address of the client a request came from. When the direct peer is a trusted proxy,
+    this is the rightmost X-Forwarded-For hop that is not itself a trusted proxy; entries
+    further left are client-supplied and could be spoofed.
+    """
+    client = scope.get("client")
+    address = client[0] if client else "unknown"
+    if address not in TRUSTED_PROXIES:
+        return address
+    forwarded = [
+        hop.strip()
+        for name, value in scope["headers"] if name == b"x-forwarded-for"
+        for hop in value.decode("latin-1").split(",")
+    ]
+    for hop in reversed(forwarded):
+        if hop and hop not in TRUSTED_PROXIES:
+            return hop
+    return address
+
+
+def tenant_key(scope) -> str:
+    """
+    Redis key identifying who a request counts against. There is no authentication yet, so
+    an operator_id in the path or query would be caller-chosen: anyone could exhaust another
+    operator's slots or dodge their own cap. Key on the client address until requests carry
+    a verified identity.
+    """
+    return f"{KEY_PREFIX}:client:{client_address(scope)}"
+
+
+class ConcurrencyLimitMiddleware:
+    """
+    Cap in-flight requests per client with a Redis sorted set shared by all workers.
+    Requests over the cap get 429; if the cap is 0, or Redis is unset or unreachable, requests
+    are let through, and after a Redis failure Redis is skipped for REDIS_BACKOFF seconds.
+    """
+
+    def __init__(self, app, limit: int = MAX_CONCURRENT_REQUESTS, stale_after: int = STALE_AFTER):
+        self.app = app
+        self.limit = limit
+        self.stale_after = stale_after
+        self._script = None
+        self._skip_until = 0.0
+
+    def _back_off(self) -> None:
+        self._skip_until = time.monotonic() + REDIS_BACKOFF
+
+    async def __call__(self, scope, receive, send):
+        client = get_redis() if scope["type"] == "http" and self.limit > 0 else None
+        if client is None or time.monotonic() < self._skip_until:
+            await self.app(scope, receive, send)
+            return
+
+        if self._script is None:
+            self._script = client.register_script(ACQUIRE_SCRIPT)
+        key = tenant_key(scope)
+        request_id = uuid.uuid4().hex
+        try:
+            admitted = await self._script(keys=[key], args=[time.time(), self.stale_after, self.limit, request_id])
+        except RedisError:
+            logger.warning("Concurrency limiter unavailable; admitting requests for %ss", REDIS_BACKOFF, exc_info=True)
+            self._back_off()
+            await self.app(scope, receive, send)
+            return
+
+        if not admitted:
+            response = ORJSONResponse(
+                {"detail": "Too many concurrent requests"},
+                status_code=429,
+                headers={"Retry-After": "1"}
+            )
+            await response(scope, receive, send)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            try:
+                await client.zrem(key, request_id)
+            except RedisError:
+                logger.warning("Failed to release concurrency slot %s", key, exc_info=True)
+                self._back_off()
@@ -0,0 +1,60 @@
+import base64
+import json
+from typing import Any, List, Optional, Tuple
+
+
+def encode_cursor(sort_value: Any, id: Any) -> str:
+    """Encode the last row's sort key and id into an opaque cursor"""
+    raw = json.dumps([sort_value, str(id)], default=str)
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[Any, str]:
+    """Decode a cursor produced by encode_cursor; raises ValueError if it is malformed"""
+    try:
+        sort_value, id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
+    return sort_value, id
+
+
+def next_cursor(rows: List[Any], sort_column: str, limit: int) -> Optional[str]:
+    """Cursor for the page after `rows`, or None when `rows` is the last page"""
+    if not rows or len(rows) < limit:
+        return None
+    last = rows[-1]
+    if not isinstance(last, dict):
+        last = {sort_column: getattr(last, sort_column), "id": last.id}
+    return encode_cursor(last[sort_column], last["id"])
+
+
+def quote_value(value: Any) -> str:
+    """Double-quote a value for a PostgREST or=/and= filter so , . ( ) in it stay literal"""
+    return '"' + str(value).replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def keyset_filter(sort_column: str, after: Tuple[Any, str], desc: bool = False) -> str:
+    """PostgREST or-filter matching rows strictly after `after` in (sort_column, id) order"""
+    sort_value, id = after
+    op = "lt" if desc else "gt"
+    value = quote_value(sort_value)
+    return f"{sort_column}.{op}.{value},and({sort_column}.eq.{value},id.{op}.{quote_value(id)})"
+
+
+def order_by(query, sort_column: str, desc: bool = False):
+    """
+    Order by (sort_column, id) as one order parameter. Each .order() call adds its own
+    order= parameter and PostgREST applies only one, which would drop the id tiebreak.
+    """
+    direction = "desc" if desc else "asc"
+    query.params = query.params.add("order", f"{sort_column}.{direction},id.{direction}")
+    return query
+
+
+def paginate(query, sort_column: str, skip: int, limit: int, after: Optional[Tuple[Any, str]], desc: bool = False):
+    """Order by (sort_column, id) and apply either the keyset cursor or the offset"""
+    if after:
+        query = query.or_(keyset_filter(sort_column, after, desc=desc))
+        skip = 0
+    return order_by(query, sort_column, desc=desc).range(skip, skip+limit-1)
+
@@ -0,0 +1,25 @@
+import os
+from typing import Optional
+
+from redis.asyncio import Redis
+
+# Redis-backed features (response cache, concurrency limits) are disabled when REDIS_URL is unset
+REDIS_URL = os.getenv("REDIS_URL")
+
+_redis: Optional[Redis] = None
+
+
+def get_redis() -> Optional[Redis]:
+    """Get the shared Redis client, or None when Redis is not configured"""
+    global _redis
+    if _redis is None and REDIS_URL:
+        _redis = Redis.from_url(REDIS_URL, socket_connect_timeout=0.5, socket_timeout=0.5)
+    return _redis
+
+
+async def close_redis() -> None:
+    """Close the Redis connection pool"""
+    global _redis
+    if _redis is not None:
+        await _redis.close()
+        _redis = None
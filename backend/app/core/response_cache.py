@@ -0,0 +1,147 @@
+import functools
+import hashlib
+import inspect
+import logging
+import time
+from typing import Any, Optional, Tuple
+
+import orjson
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from redis.exceptions import RedisError
+
+from app.core.redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "cache"
+
+# Lists change as rows are written; aggregates are invalidated on every write anyway
+LIST_CACHE_TTL = 120
+STATS_CACHE_TTL = 3600
+
+# "Latest reading" routes track incoming data, so they expire quickly
+LATEST_CACHE_TTL = 60
+
+# How long clients may reuse a statistics payload before revalidating it with If-None-Match
+STATS_MAX_AGE = 30
+
+# Response headers set by the handler that must be replayed on a cache hit
+CACHED_HEADERS = ("X-Next-Cursor", "ETag", "Cache-Control")
+
+
+def generation_key(namespace: str) -> str:
+    """Counter bumped on every write to `namespace`; it is part of every response key"""
+    return f"{KEY_PREFIX}:{namespace}:gen"
+
+
+def cache_key(namespace: str, generation: int, request: Request) -> str:
+    """Key a response on its namespace generation, route and sorted query parameters"""
+    raw = f"{request.url.path}:{sorted(request.query_params.multi_items())}"
+    return f"{KEY_PREFIX}:{namespace}:{generation}:{hashlib.sha256(raw.encode()).hexdigest()}"
+
+
+async def _lookup(namespace: str, request: Request) -> Tuple[Optional[str], Optional[Any]]:
+    """
+    Current key for this request and its cached entry, if any. The key is fixed before the
+    handler runs, so a body computed before a write is stored under the stale generation.
+    """
+    client = get_redis()
+    if client is None:
+        return None, None
+    try:
+        generation = await client.get(generation_key(namespace))
+        if generation is None:
+            # Seed from the clock, not 0, so a counter lost to eviction cannot revive old entries
+            await client.set(generation_key(namespace), time.time_ns(), nx=True)
+            generation = await client.get(generation_key(namespace))
+        key = cache_key(namespace, int(generation), request)
+        raw = await client.get(key)
+    except RedisError:
+        logger.warning("Response cache read failed for %s", namespace, exc_info=True)
+        return None, None
+    return key, orjson.loads(raw) if raw is not None else None
+
+
+async def _set(key: str, value: Any, ttl: int) -> None:
+    client = get_redis()
+    if client is None:
+        return
+    try:
+        await client.set(key, orjson.dumps(value), ex=ttl)
+    except RedisError:
+        logger.warning("Response cache write failed for %s", key, exc_info=True)
+
+
+async def invalidate_cache(namespace: str) -> None:
+    """
+    Retire every cached response in `namespace`; called after writes to that resource.
+    Bumping the generation is O(1); entries under older generations expire by TTL.
+    """
+    client = get_redis()
+    if client is None:
+        return
+    try:
+        await client.incr(generation_key(namespace))
+    except RedisError:
+        logger.warning("Response cache invalidation failed for %s", namespace, exc_info=True)
+
+
+def _body_etag(body: Any) -> str:
+    """Weak ETag for a JSON-encodable body, so identical payloads share a tag"""
+    return f'W/"{hashlib.sha256(orjson.dumps(body)).hexdigest()[:32]}"'
+
+
+def _not_modified(request: Request, headers: dict) -> Optional[Response]:
+    """A 304 when If-None-Match already names the body's ETag"""
+    etag = headers.get("ETag")
+    header = request.headers.get("if-none-match")
+    if etag and header and etag in (tag.strip() for tag in header.split(",")):
+        return Response(status_code=304, headers=headers)
+    return None
+
+
+def cache_response(namespace: str, ttl: int, max_age: Optional[int] = None):
+    """
+    Cache an async endpoint's JSON-encoded result in Redis for `ttl` seconds.
+    Sets X-Cache: HIT/MISS on the response; use invalidate_cache(namespace) on writes.
+    With max_age, responses also carry an ETag of the body and a Cache-Control header,
+    and a matching If-None-Match is answered with an empty 304.
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def wrapper(*args, _cache_request: Request, _cache_response: Response, **kwargs):
+            key, cached = await _lookup(namespace, _cache_request)
+            if cached is not None:
+                not_modified = _not_modified(_cache_request, cached["headers"])
+                if not_modified is not None:
+                    return not_modified
+                _cache_response.headers.update(cached["headers"])
+                _cache_response.headers["X-Cache"] = "HIT"
+                return cached["body"]
+
+            result = await func(*args, **kwargs)
+            body = jsonable_encoder(result)
+            _cache_response.headers["X-Cache"] = "MISS"
+            if max_age is not None:
+                _cache_response.headers["ETag"] = _body_etag(body)
+                _cache_response.headers["Cache-Control"] = f"max-age={max_age}, stale-while-revalidate={2 * max_age}"
+            headers = {name: _cache_response.headers[name] for name in CACHED_HEADERS if name in _cache_response.headers}
+            if key is not None:
+                await _set(key, {"body": body, "headers": headers}, ttl)
+            not_modified = _not_modified(_cache_request, headers)
+            if not_modified is not None:
+                return not_modified
+            return result
+
+        # Let FastAPI inject the request and response alongside the endpoint's own parameters
+        wrapper.__signature__ = signature.replace(parameters=[
+            *signature.parameters.values(),
+            inspect.Parameter("_cache_request", inspect.Parameter.KEYWORD_ONLY, annotation=Request),
+            inspect.Parameter("_cache_response", inspect.Parameter.KEYWORD_ONLY, annotation=Response),
+        ])
+        return wrapper
+
+    return decorator
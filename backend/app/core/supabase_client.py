@@ -1,4 +1,13 @@
+import asyncio
+from datetime import datetime
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+import httpx
 from supabase import create_client, Client
+# supabase 2.3.4 only re-exports the sync client at the top level
+from supabase._async.client import AsyncClient, create_client as acreate_client
+from supabase.lib.client_options import ClientOptions
 from dotenv import load_dotenv
 import os
 
@@ -12,9 +21,96 @@ SUPABASE_KEY = os.getenv("SUPABASE_KEY")
 if not SUPABASE_URL or not SUPABASE_KEY:
     raise ValueError("SUPABASE_URL and SUPABASE_KEY must be set in environment variables")
 
-# Create Supabase client
-supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
+# Seconds to wait on PostgREST before giving up; just above the longest role statement_timeout
+# (8s, see the role_statement_timeout migration) so the database cancels a slow query first
+SUPABASE_TIMEOUT = int(os.getenv("SUPABASE_TIMEOUT", "10"))
+
+# httpx drops idle keep-alive connections after 5s and keeps at most 20 by default, so a
+# quiet spell or a burst means fresh TLS handshakes; keep more connections warm for longer
+POSTGREST_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50, keepalive_expiry=30)
+
+def _client_options() -> ClientOptions:
+    return ClientOptions(postgrest_client_timeout=SUPABASE_TIMEOUT)
+
+def _session_settings(postgrest) -> dict:
+    """
+    Settings of the PostgREST session supabase-py built, plus our pool limits.
+    httpx does not expose a client's verify flag, so it is read from the PostgREST
+    client that passed it in; trust_env carries over environment proxies and CA bundles.
+    """
+    session = postgrest.session
+    return dict(
+        base_url=session.base_url,
+        headers=session.headers,
+        timeout=session.timeout,
+        follow_redirects=session.follow_redirects,
+        verify=getattr(postgrest, "verify", True),
+        trust_env=session.trust_env,
+        limits=POSTGREST_LIMITS,
+    )
+
+def _with_tuned_session(client: Client) -> Client:
+    """Swap the client's PostgREST session for one using POSTGREST_LIMITS"""
+    session = client.postgrest.session
+    client.postgrest.session = httpx.Client(**_session_settings(client.postgrest))
+    session.close()
+    return client
+
+# Create Supabase client once per process; its httpx pool keeps connections to the gateway alive
+supabase: Client = _with_tuned_session(create_client(SUPABASE_URL, SUPABASE_KEY, options=_client_options()))
 
 def get_supabase() -> Client:
     """Get Supabase client instance"""
     return supabase
+
+def rpc_params(**filters: Any) -> Dict[str, Any]:
+    """JSON arguments for an SQL function; unset filters are left out so the function's NULL default applies"""
+    params: Dict[str, Any] = {}
+    for name, value in filters.items():
+        if value is None or value == "":
+            continue
+        if isinstance(value, UUID):
+            value = str(value)
+        elif isinstance(value, datetime):
+            value = value.isoformat()
+        params[name] = value
+    return params
+
+def warm_up_supabase() -> None:
+    """Issue a trivial query so the TLS connection is open before the first real request"""
+    supabase.table("interventions").select("id").limit(1).execute()
+
+
+# Async client for request handlers; created in the app lifespan because building it is a coroutine
+async_supabase: Optional[AsyncClient] = None
+
+# Concurrent first callers would otherwise each build a client (and a pool) and leak all but one
+_async_init_lock = asyncio.Lock()
+
+async def init_async_supabase() -> AsyncClient:
+    """Create the shared async Supabase client (idempotent)"""
+    global async_supabase
+    async with _async_init_lock:
+        if async_supabase is None:
+            client = await acreate_client(SUPABASE_URL, SUPABASE_KEY, options=_client_options())
+            session = client.postgrest.session
+            client.postgrest.session = httpx.AsyncClient(**_session_settings(client.postgrest))
+            await session.aclose()
+            async_supabase = client
+    return async_supabase
+
+async def get_async_supabase() -> AsyncClient:
+    """Get the shared async Supabase client, creating it if startup has not run"""
+    return async_supabase or await init_async_supabase()
+
+async def warm_up_async_supabase() -> None:
+    """Async counterpart of warm_up_supabase for the handler-facing client"""
+    client = await get_async_supabase()
+    await client.table("interventions").select("id").limit(1).execute()
+
+async def close_async_supabase() -> None:
+    """Close the async client's pooled connections"""
+    global async_supabase
+    if async_supabase is not None:
+        await async_supabase.postgrest.aclose()
+        async_supabase = None
@@ -1,214 +1,125 @@
-# TODO: Refactor this CRUD module for Supabase. All SQLAlchemy code removed.
-
-from typing import List, Optional, Dict, Any
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, func
-from datetime import datetime, timedelta
+from typing import List, Optional, Dict, Any, Tuple
 from uuid import UUID
 
-from app.schemas.data_source import DataSource
-from app.schemas.data_source import DataSourceCreate, DataSourceUpdate
-from app.core.supabase_client import get_supabase
+from app.schemas.data_source import DataSourceSummary, DataSourceUpdate
+from app.core.cache import ttl_cache
+from app.core.pagination import keyset_filter, order_by, paginate, quote_value
+from app.core.supabase_client import get_async_supabase
 
+# Dashboards poll the statistics endpoint; a short TTL collapses those polls into one aggregation
+STATISTICS_TTL = 60
 
-def create_data_source(data: dict):
-    response = get_supabase().table("data_sources").insert(data).execute()
-    return response.data
+# Data source rows change rarely; writes in this process evict their entry
+BY_ID_TTL = 30
 
+# List endpoints skip the JSON columns (coverage, metrics, schema, config, headers)
+SUMMARY_COLUMNS = ", ".join(DataSourceSummary.model_fields)
 
-def get_data_source_by_id(id: str):
-    response = get_supabase().table("data_sources").select("*").eq("id", id).single().execute()
-    return response.data
 
-
-def update_data_source(id: str, data: dict):
-    response = get_supabase().table("data_sources").update(data).eq("id", id).execute()
-    return response.data
+def _page(query, skip: int, limit: int, after: Optional[Tuple[Any, str]]):
+    """Order by (name, id) and apply either the keyset cursor or the offset"""
+    return paginate(query, "name", skip, limit, after)
 
 
-def delete_data_source(id: str):
-    response = get_supabase().table("data_sources").delete().eq("id", id).execute()
+async def create_data_source(data: dict):
+    """Insert a data source; returns no rows if the name is already taken"""
+    supabase = await get_async_supabase()
+    response = await supabase.table("data_sources").upsert(data, on_conflict="name", ignore_duplicates=True).execute()
+    get_data_source_statistics.cache_clear()
     return response.data
 
 
-def get_data_source(db: Session, data_source_id: UUID) -> Optional[DataSource]:
-    """Get data source by ID"""
-    return db.query(DataSource).filter(DataSource.id == data_source_id).first()
+@ttl_cache(ttl=BY_ID_TTL, maxsize=10_000)
+async def get_data_source_by_id(id: str):
+    supabase = await get_async_supabase()
+    response = await supabase.table("data_sources").select("*").eq("id", id).maybe_single().execute()
+    return response.data if response else None
 
 
-def get_data_source_by_name(db: Session, name: str) -> Optional[DataSource]:
+async def get_data_source_by_name(name: str) -> Optional[Dict[str, Any]]:
     """Get data source by name"""
-    return db.query(DataSource).filter(DataSource.name == name).first()
-
-
-def get_data_sources_by_type(
-    db: Session, 
-    source_type: str, 
-    skip: int = 0, 
-    limit: int = 100
-) -> List[DataSource]:
-    """Get data sources by type"""
-    return db.query(DataSource).filter(
-        DataSource.source_type == source_type
-    ).order_by(DataSource.name).offset(skip).limit(limit).all()
-
-
-def get_data_sources_by_provider(
-    db: Session, 
-    provider: str, 
-    skip: int = 0, 
-    limit: int = 100
-) -> List[DataSource]:
-    """Get data sources by provider"""
-    return db.query(DataSource).filter(
-        DataSource.provider == provider
-    ).order_by(DataSource.name).offset(skip).limit(limit).all()
-
-
-def get_active_data_sources(
-    db: Session, 
-    skip: int = 0, 
-    limit: int = 100
-) -> List[DataSource]:
+    supabase = await get_async_supabase()
+    response = await supabase.table("data_sources").select("*").eq("name", name).limit(1).execute()
+    return response.data[0] if response.data else None
+
+
+async def get_active_data_sources(skip: int = 0, limit: int = 100, after: Optional[Tuple[Any, str]] = None) -> List[Dict[str, Any]]:
     """Get all active data sources"""
-    return db.query(DataSource).filter(
-        DataSource.is_active == True
-    ).order_by(DataSource.name).offset(skip).limit(limit).all()
-
-
-def get_data_sources_by_authentication(
-    db: Session, 
-    requires_auth: bool, 
-    skip: int = 0, 
-    limit: int = 100
-) -> List[DataSource]:
-    """Get data sources by authentication requirement"""
-    return db.query(DataSource).filter(
-        DataSource.requires_authentication == requires_auth
-    ).order_by(DataSource.name).offset(skip).limit(limit).all()
-
-
-def get_data_sources_by_update_frequency(
-    db: Session, 
-    frequency: str, 
-    skip: int = 0, 
-    limit: int = 100
-) -> List[DataSource]:
-    """Get data sources by update frequency"""
-    return db.query(DataSource).filter(
-        DataSource.update_frequency == frequency
-    ).order_by(DataSource.name).offset(skip).limit(limit).all()
-
-
-def get_data_source_statistics(db: Session) -> Dict[str, Any]:
-    """Get statistics for data sources"""
-    total_sources = db.query(DataSource).count()
-    active_sources = db.query(DataSource).filter(DataSource.is_active == True).count()
-    auth_required = db.query(DataSource).filter(DataSource.requires_authentication == True).count()
-    
-    # Count by type
-    type_counts = db.query(
-        DataSource.source_type, 
-        func.count(DataSource.id)
-    ).group_by(DataSource.source_type).all()
-    
-    # Count by provider
-    provider_counts = db.query(
-        DataSource.provider, 
-        func.count(DataSource.id)
-    ).filter(DataSource.provider.isnot(None)).group_by(DataSource.provider).all()
-    
-    # Average quality scores
-    avg_quality = db.query(func.avg(DataSource.data_quality_score)).scalar()
-    avg_reliability = db.query(func.avg(DataSource.reliability_score)).scalar()
-    
-    stats = {
-        "total_sources": total_sources,
-        "active_sources": active_sources,
-        "inactive_sources": total_sources - active_sources,
-        "auth_required": auth_required,
-        "no_auth_required": total_sources - auth_required,
-        "type_distribution": dict(type_counts),
-        "provider_distribution": dict(provider_counts),
-        "avg_data_quality": avg_quality,
-        "avg_reliability": avg_reliability,
-    }
-    
-    return stats
-
-
-def update_data_source(
-    db: Session, 
-    data_source_id: UUID, 
-    data_source_update: DataSourceUpdate
-) -> Optional[DataSource]:
+    supabase = await get_async_supabase()
+    response = await _page(supabase.table("data_sources").select(SUMMARY_COLUMNS).eq("is_active", True), skip, limit, after).execute()
+    return response.data
+
+
+@ttl_cache(ttl=STATISTICS_TTL, maxsize=1)
+async def get_data_source_statistics() -> Dict[str, Any]:
+    """Get statistics for data sources, aggregated by the data_source_statistics SQL function"""
+    supabase = await get_async_supabase()
+    response = await supabase.rpc("data_source_statistics", {}).execute()
+    return response.data[0]
+
+
+async def update_data_source(data_source_id: UUID, data_source_update: DataSourceUpdate) -> Optional[Dict[str, Any]]:
     """Update data source"""
-    db_data_source = get_data_source(db, data_source_id)
-    if db_data_source:
-        update_data = data_source_update.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(db_data_source, field, value)
-        db.commit()
-        db.refresh(db_data_source)
-    return db_data_source
-
-
-def update_data_source_status(
-    db: Session, 
-    data_source_id: UUID, 
-    is_active: bool,
-    last_error: Optional[str] = None
-) -> Optional[DataSource]:
-    """Update data source status and error information"""
-    db_data_source = get_data_source(db, data_source_id)
-    if db_data_source:
-        db_data_source.is_active = is_active
-        if is_active:
-            db_data_source.last_successful_fetch = datetime.utcnow()
-            db_data_source.last_error = None
-        else:
-            db_data_source.last_error = last_error
-            db_data_source.error_count += 1
-        db.commit()
-        db.refresh(db_data_source)
-    return db_data_source
-
-
-def get_data_source_list(
-    db: Session, 
-    skip: int = 0, 
-    limit: int = 100,
-    source_type: Optional[str] = None,
-    provider: Optional[str] = None,
-    is_active: Optional[bool] = None,
-    requires_auth: Optional[bool] = None
-) -> List[DataSource]:
+    update_data = data_source_update.model_dump(mode="json", exclude_unset=True)
+    if not update_data:
+        return await get_data_source_by_id(str(data_source_id))
+    supabase = await get_async_supabase()
+    response = await supabase.table("data_sources").update(update_data).eq("id", str(data_source_id)).execute()
+    get_data_source_by_id.cache_pop(str(data_source_id))
+    get_data_source_statistics.cache_clear()
+    return response.data[0] if response.data else None
+
+
+async def update_data_source_status(data_source_id: UUID, is_active: bool, last_error: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """Update data source status and error information; error_count is incremented atomically in SQL"""
+    supabase = await get_async_supabase()
+    response = await supabase.rpc("set_data_source_status", {
+        "data_source_id": str(data_source_id),
+        "is_active": is_active,
+        "last_error": last_error,
+    }).execute()
+    get_data_source_by_id.cache_pop(str(data_source_id))
+    get_data_source_statistics.cache_clear()
+    return response.data[0] if response.data else None
+
+
+async def delete_data_source(data_source_id: UUID):
+    supabase = await get_async_supabase()
+    response = await supabase.table("data_sources").delete().eq("id", str(data_source_id)).execute()
+    get_data_source_by_id.cache_pop(str(data_source_id))
+    get_data_source_statistics.cache_clear()
+    return response.data
+
+
+async def get_data_source_list(skip: int = 0, limit: int = 100, source_type: Optional[str] = None, provider: Optional[str] = None, is_active: Optional[bool] = None, requires_auth: Optional[bool] = None, update_frequency: Optional[str] = None, after: Optional[Tuple[Any, str]] = None) -> List[Dict[str, Any]]:
     """Get list of data sources with optional filters"""
-    query = db.query(DataSource)
-    
+    supabase = await get_async_supabase()
+    query = supabase.table("data_sources").select(SUMMARY_COLUMNS)
     if source_type:
-        query = query.filter(DataSource.source_type == source_type)
+        query = query.eq("source_type", source_type)
     if provider:
-        query = query.filter(DataSource.provider == provider)
+        query = query.eq("provider", provider)
     if is_active is not None:
-        query = query.filter(DataSource.is_active == is_active)
+        query = query.eq("is_active", is_active)
     if requires_auth is not None:
-        query = query.filter(DataSource.requires_authentication == requires_auth)
-    
-    return query.order_by(DataSource.name).offset(skip).limit(limit).all()
-
-
-def search_data_sources(
-    db: Session, 
-    search_term: str, 
-    skip: int = 0, 
-    limit: int = 100
-) -> List[DataSource]:
-    """Search data sources by name or description"""
-    return db.query(DataSource).filter(
-        or_(
-            DataSource.name.ilike(f"%{search_term}%"),
-            DataSource.description.ilike(f"%{search_term}%"),
-            DataSource.provider.ilike(f"%{search_term}%")
-        )
-    ).order_by(DataSource.name).offset(skip).limit(limit).all() 
\ No newline at end of file
+        query = query.eq("requires_authentication", requires_auth)
+    if update_frequency:
+        query = query.eq("update_frequency", update_frequency)
+    response = await _page(query, skip, limit, after).execute()
+    return response.data
+
+
+async def search_data_sources(search_term: str, skip: int = 0, limit: int = 100, after: Optional[Tuple[Any, str]] = None) -> List[Dict[str, Any]]:
+    """Search data sources by name, description, or provider"""
+    supabase = await get_async_supabase()
+    pattern = quote_value(f"%{search_term}%")
+    search_filter = f"name.ilike.{pattern},description.ilike.{pattern},provider.ilike.{pattern}"
+    query = supabase.table("data_sources").select(SUMMARY_COLUMNS)
+    if after:
+        # Both the search and the keyset predicate are or-groups, so AND them in one expression
+        query = query.or_(f"and(or({search_filter}),or({keyset_filter('name', after)}))")
+        skip = 0
+    else:
+        query = query.or_(search_filter)
+    response = await order_by(query, "name").range(skip, skip+limit-1).execute()
+    return response.data
@@ -1,51 +1,147 @@
-from typing import List, Optional, Tuple
-from supabase import Client
-from datetime import datetime
+from typing import Any, List, Literal, Optional, Tuple
+from pydantic import TypeAdapter
+from supabase._async.client import AsyncClient
 from uuid import UUID
 
-from app.schemas.intervention import InterventionCreate, InterventionUpdate, InterventionInDB
-from app.core.supabase_client import get_supabase
+from app.schemas.intervention import InterventionCreate, InterventionUpdate, InterventionInDB, InterventionSummary
+from app.core.pagination import paginate, quote_value
+
+# PostgREST count strategies: "exact" runs COUNT(*), "planned" reads the planner's row
+# estimate, "estimated" counts exactly up to the max-rows limit and uses the plan beyond it
+CountMode = Literal["exact", "planned", "estimated"]
+
+# Operator/type/status listings leave out the deployment_data JSON
+SUMMARY_COLUMNS = ", ".join(InterventionSummary.model_fields)
+
+# Validate whole pages in one pydantic-core call rather than constructing a model per row
+INTERVENTION_LIST = TypeAdapter(List[InterventionInDB])
+SUMMARY_LIST = TypeAdapter(List[InterventionSummary])
 
 
 class InterventionCRUD:
     """CRUD operations for Intervention model using Supabase"""
 
-    def create(self, supabase: Client, obj_in: InterventionCreate) -> InterventionInDB:
+    async def create(self, supabase: AsyncClient, obj_in: InterventionCreate) -> InterventionInDB:
         """Create a new intervention"""
-        obj_data = obj_in.model_dump(exclude_none=True)
+        obj_data = obj_in.model_dump(mode="json", exclude_none=True)
         
         # Insert into Supabase
-        response = get_supabase().table("interventions").insert(obj_data).execute()
+        response = await supabase.table("interventions").insert(obj_data).execute()
         
         if not response.data:
             raise Exception("Failed to create intervention")
         
-        return InterventionInDB(**response.data[0])
+        return InterventionInDB.model_validate(response.data[0])
 
-    def get(self, supabase: Client, id: UUID) -> Optional[InterventionInDB]:
-        """Get intervention by ID"""
-        response = get_supabase().table("interventions").select("*").eq("id", str(id)).single().execute()
+    async def create_multi(self, supabase: AsyncClient, objs_in: List[InterventionCreate]) -> List[InterventionInDB]:
+        """Create several interventions with a single insert"""
+        rows = [obj_in.model_dump(mode="json", exclude_none=True) for obj_in in objs_in]
+        
+        # Supabase accepts a list payload, so the whole batch is one round-trip
+        response = await supabase.table("interventions").insert(rows).execute()
         
         if not response.data:
+            raise Exception("Failed to create interventions")
+        
+        return INTERVENTION_LIST.validate_python(response.data)
+
+    async def get(self, supabase: AsyncClient, id: UUID) -> Optional[InterventionInDB]:
+        """Get intervention by ID"""
+        response = await supabase.table("interventions").select("*").eq("id", str(id)).maybe_single().execute()
+        
+        if not response or not response.data:
             return None
         
-        return InterventionInDB(**response.data)
+        return InterventionInDB.model_validate(response.data)
 
-    def get_multi(
+    async def get_version(self, supabase: AsyncClient, id: UUID) -> Optional[dict]:
+        """Get only the id and updated_at of an intervention, for conditional GETs"""
+        response = await supabase.table("interventions").select("id, updated_at").eq("id", str(id)).limit(1).execute()
+        return response.data[0] if response.data else None
+
+    async def get_multi(
         self, 
-        supabase: Client, 
+        supabase: AsyncClient, 
         *, 
         skip: int = 0, 
         limit: int = 100,
         intervention_type: Optional[str] = None,
         operator_id: Optional[UUID] = None,
         status: Optional[str] = None,
+        search: Optional[str] = None,
+        after: Optional[Tuple[Any, str]] = None,
+        include_total: bool = False,
+        count_mode: CountMode = "estimated"
+    ) -> Tuple[List[InterventionInDB], Optional[int], bool]:
+        """
+        Get multiple interventions with optional filtering and pagination.
+        Returns the page, the total (None unless include_total or already known) and whether more rows follow.
+        """
+        query = self._filter(
+            supabase.table("interventions").select("*"),
+            intervention_type=intervention_type,
+            operator_id=operator_id,
+            status=status,
+            search=search
+        )
+        
+        # Fetch one extra row to learn whether a later page exists; a cursor continues
+        # after (created_at, id) instead of skipping rows
+        response = await paginate(query, "created_at", skip, limit + 1, after).execute()
+        rows = response.data
+        has_more = len(rows) > limit
+        
+        # On the last offset page the total follows from the rows; otherwise COUNT only on request
+        if not has_more and not after and (rows or skip == 0):
+            total = skip + len(rows)
+        elif include_total:
+            total = await self.count(
+                supabase,
+                intervention_type=intervention_type,
+                operator_id=operator_id,
+                status=status,
+                search=search,
+                count_mode=count_mode
+            )
+        else:
+            total = None
+        
+        interventions = INTERVENTION_LIST.validate_python(rows[:limit])
+        
+        return interventions, total, has_more
+
+    async def count(
+        self,
+        supabase: AsyncClient,
+        *,
+        intervention_type: Optional[str] = None,
+        operator_id: Optional[UUID] = None,
+        status: Optional[str] = None,
+        search: Optional[str] = None,
+        count_mode: CountMode = "exact"
+    ) -> int:
+        """Count interventions matching the filters without fetching any rows"""
+        query = self._filter(
+            supabase.table("interventions").select("id", count=count_mode, head=True),
+            intervention_type=intervention_type,
+            operator_id=operator_id,
+            status=status,
+            search=search
+        )
+        
+        response = await query.execute()
+        return response.count or 0
+
+    def _filter(
+        self,
+        query,
+        *,
+        intervention_type: Optional[str] = None,
+        operator_id: Optional[UUID] = None,
+        status: Optional[str] = None,
         search: Optional[str] = None
-    ) -> Tuple[List[InterventionInDB], int]:
-        """Get multiple interventions with optional filtering and pagination"""
-        query = get_supabase().table("interventions").select("*", count="exact")
-        
-        # Apply filters
+    ):
+        """Apply the list/count filters to a query"""
         if intervention_type:
             query = query.eq("intervention_type", intervention_type)
         if operator_id:
@@ -53,108 +149,84 @@ class InterventionCRUD:
         if status:
             query = query.eq("status", status)
         if search:
-            query = query.or_(f"name.ilike.%{search}%,description.ilike.%{search}%")
-        
-        # Apply pagination
-        query = query.range(skip, skip + limit - 1)
-        
-        response = query.execute()
-        
-        interventions = [InterventionInDB(**item) for item in response.data]
-        total = response.count or 0
-        
-        return interventions, total
+            pattern = quote_value(f"%{search}%")
+            query = query.or_(f"name.ilike.{pattern},description.ilike.{pattern}")
+        return query
 
-    def update(
+    async def update(
         self, 
-        supabase: Client, 
+        supabase: AsyncClient, 
         *, 
         id: UUID,
         obj_in: InterventionUpdate
     ) -> Optional[InterventionInDB]:
         """Update an intervention"""
-        update_data = obj_in.model_dump(exclude_unset=True, exclude_none=True)
+        update_data = obj_in.model_dump(mode="json", exclude_unset=True, exclude_none=True)
         
         if not update_data:
-            return self.get(supabase, id)
+            return await self.get(supabase, id)
         
-        # Add updated_at timestamp
-        update_data["updated_at"] = datetime.utcnow().isoformat()
-        
-        response = get_supabase().table("interventions").update(update_data).eq("id", str(id)).execute()
+        response = await supabase.table("interventions").update(update_data).eq("id", str(id)).execute()
         
         if not response.data:
             return None
         
-        return InterventionInDB(**response.data[0])
+        return InterventionInDB.model_validate(response.data[0])
 
-    def delete(self, supabase: Client, *, id: UUID) -> bool:
+    async def delete(self, supabase: AsyncClient, *, id: UUID) -> bool:
         """Delete an intervention"""
-        response = get_supabase().table("interventions").delete().eq("id", str(id)).execute()
+        response = await supabase.table("interventions").delete().eq("id", str(id)).execute()
         return len(response.data) > 0
 
-    def get_by_operator(self, supabase: Client, operator_id: UUID) -> List[InterventionInDB]:
+    async def get_by_operator(
+        self,
+        supabase: AsyncClient,
+        operator_id: UUID,
+        skip: int = 0,
+        limit: int = 100,
+        after: Optional[Tuple[Any, str]] = None
+    ) -> List[InterventionSummary]:
         """Get all interventions by a specific operator"""
-        response = get_supabase().table("interventions").select("*").eq("operator_id", str(operator_id)).execute()
-        return [InterventionInDB(**item) for item in response.data]
-
-    def get_by_type(self, supabase: Client, intervention_type: str) -> List[InterventionInDB]:
+        query = supabase.table("interventions").select(SUMMARY_COLUMNS).eq("operator_id", str(operator_id))
+        response = await paginate(query, "created_at", skip, limit, after).execute()
+        return SUMMARY_LIST.validate_python(response.data)
+
+    async def get_by_type(
+        self,
+        supabase: AsyncClient,
+        intervention_type: str,
+        skip: int = 0,
+        limit: int = 100,
+        after: Optional[Tuple[Any, str]] = None
+    ) -> List[InterventionSummary]:
         """Get all interventions of a specific type"""
-        response = get_supabase().table("interventions").select("*").eq("intervention_type", intervention_type).execute()
-        return [InterventionInDB(**item) for item in response.data]
-
-    def get_by_status(self, supabase: Client, status: str) -> List[InterventionInDB]:
+        query = supabase.table("interventions").select(SUMMARY_COLUMNS).eq("intervention_type", intervention_type)
+        response = await paginate(query, "created_at", skip, limit, after).execute()
+        return SUMMARY_LIST.validate_python(response.data)
+
+    async def get_by_status(
+        self,
+        supabase: AsyncClient,
+        status: str,
+        skip: int = 0,
+        limit: int = 100,
+        after: Optional[Tuple[Any, str]] = None
+    ) -> List[InterventionSummary]:
         """Get all interventions with a specific status"""
-        response = get_supabase().table("interventions").select("*").eq("status", status).execute()
-        return [InterventionInDB(**item) for item in response.data]
-
-    def get_total_capacity(self, supabase: Client) -> float:
-        """Get total scale amount across all interventions"""
-        response = get_supabase().table("interventions").select("scale_amount").execute()
-        return sum(item.get("scale_amount", 0) for item in response.data)
-
-    def get_capacity_by_type(self, supabase: Client) -> List[dict]:
-        """Get scale amount grouped by intervention type"""
-        response = get_supabase().table("interventions").select("intervention_type, scale_amount").execute()
-        
-        # Group by intervention type
-        grouped = {}
-        for item in response.data:
-            intervention_type = item["intervention_type"]
-            scale_amount = item.get("scale_amount", 0)
-            
-            if intervention_type not in grouped:
-                grouped[intervention_type] = {"total_scale": 0, "count": 0}
-            
-            grouped[intervention_type]["total_scale"] += scale_amount
-            grouped[intervention_type]["count"] += 1
-        
-        return [
-            {
-                "intervention_type": intervention_type,
-                "total_scale": data["total_scale"],
-                "count": data["count"]
-            }
-            for intervention_type, data in grouped.items()
-        ]
-
-
-# Create a singleton instance
-intervention = InterventionCRUD()
+        query = supabase.table("interventions").select(SUMMARY_COLUMNS).eq("status", status)
+        response = await paginate(query, "created_at", skip, limit, after).execute()
+        return SUMMARY_LIST.validate_python(response.data)
 
-# --- Supabase CRUD Operations for Interventions ---
-def create_intervention(data: dict):
-    response = get_supabase().table("interventions").insert(data).execute()
-    return response.data
+    async def get_total_capacity(self, supabase: AsyncClient) -> float:
+        """Get total scale amount across all interventions, summed by the get_total_intervention_capacity SQL function"""
+        response = await supabase.rpc("get_total_intervention_capacity", {}).execute()
+        return response.data
 
-def get_intervention_by_id(id: str):
-    response = get_supabase().table("interventions").select("*").eq("id", id).single().execute()
-    return response.data
+    async def get_capacity_by_type(self, supabase: AsyncClient) -> List[dict]:
+        """Get scale amount grouped by intervention type, aggregated by the get_capacity_by_intervention_type SQL function"""
+        response = await supabase.rpc("get_capacity_by_intervention_type", {}).execute()
+        return response.data
 
-def update_intervention(id: str, data: dict):
-    response = get_supabase().table("interventions").update(data).eq("id", id).execute()
-    return response.data
 
-def delete_intervention(id: str):
-    response = get_supabase().table("interventions").delete().eq("id", id).execute()
-    return response.data
\ No newline at end of file
+# Create a singleton instance
+intervention = InterventionCRUD()
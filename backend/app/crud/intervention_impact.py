@@ -1,144 +1,216 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple, Sequence
 from uuid import UUID
 from datetime import datetime
-# TODO: Refactor this CRUD module for Supabase. All SQLAlchemy code removed.
 
-from app.schemas.intervention_impact import InterventionImpact
-from app.schemas.intervention_impact import InterventionImpactCreate, InterventionImpactUpdate
-from app.core.supabase_client import get_supabase
+from app.schemas.intervention_impact import InterventionImpactCreate, InterventionImpactUpdate, InterventionImpactSummary, InterventionImpactEnriched
+from app.core.pagination import paginate
+from app.core.supabase_client import get_async_supabase, rpc_params
 
+# List endpoints skip the JSON detail columns (side effects, periods, uncertainty)
+SUMMARY_COLUMNS = ", ".join(InterventionImpactSummary.model_fields)
+ENRICHED_COLUMNS = ", ".join(InterventionImpactEnriched.model_fields)
 
-def create_intervention_impact(data: dict):
-    response = get_supabase().table("intervention_impacts").insert(data).execute()
+
+def _page(query, sort_column: str, skip: int, limit: int, after: Optional[Tuple[Any, str]]):
+    """Newest/highest first, with id as the tiebreak"""
+    return paginate(query, sort_column, skip, limit, after, desc=True)
+
+
+def _filter(
+    query,
+    intervention_id: Optional[UUID] = None,
+    grid_cell_id: Optional[UUID] = None,
+    start_time: Optional[datetime] = None,
+    end_time: Optional[datetime] = None,
+    min_effectiveness: Optional[float] = None
+):
+    """Apply the impact list filters to a query"""
+    if intervention_id:
+        query = query.eq("intervention_id", str(intervention_id))
+    if grid_cell_id:
+        query = query.eq("grid_cell_id", str(grid_cell_id))
+    if start_time:
+        query = query.gte("timestamp", start_time.isoformat())
+    if end_time:
+        query = query.lte("timestamp", end_time.isoformat())
+    if min_effectiveness is not None:
+        query = query.gte("effectiveness_score", min_effectiveness)
+    return query
+
+
+async def create_intervention_impact(data: dict):
+    supabase = await get_async_supabase()
+    response = await supabase.table("intervention_impacts").insert(data).execute()
     return response.data
 
 
-def get_intervention_impact_by_id(id: str):
-    response = get_supabase().table("intervention_impacts").select("*").eq("id", id).single().execute()
+async def create_intervention_impacts(objs_in: List[InterventionImpactCreate]):
+    """Insert several rows with a single statement"""
+    rows = [obj_in.model_dump(mode="json", exclude_none=True) for obj_in in objs_in]
+    supabase = await get_async_supabase()
+    response = await supabase.table("intervention_impacts").insert(rows).execute()
     return response.data
 
 
-def update_intervention_impact(id: str, data: dict):
-    response = get_supabase().table("intervention_impacts").update(data).eq("id", id).execute()
+async def get_intervention_impact_by_id(id: str):
+    supabase = await get_async_supabase()
+    response = await supabase.table("intervention_impacts").select("*").eq("id", id).maybe_single().execute()
+    return response.data if response else None
+
+
+async def get_intervention_impacts_by_ids(ids: Sequence[UUID]) -> List[Dict[str, Any]]:
+    """Get several rows with one IN query, in the order of `ids`; unknown ids are left out"""
+    keys = list(dict.fromkeys(str(id) for id in ids))
+    supabase = await get_async_supabase()
+    response = await supabase.table("intervention_impacts").select("*").in_("id", keys).execute()
+    rows = {row["id"]: row for row in response.data}
+    return [rows[key] for key in keys if key in rows]
+
+
+async def get_intervention_impact_version(id: str):
+    """Get only the id and updated_at of a row, for conditional GETs"""
+    supabase = await get_async_supabase()
+    response = await supabase.table("intervention_impacts").select("id, updated_at").eq("id", id).limit(1).execute()
+    return response.data[0] if response.data else None
+
+
+async def update_intervention_impact(id: str, data: dict):
+    supabase = await get_async_supabase()
+    response = await supabase.table("intervention_impacts").update(data).eq("id", id).execute()
     return response.data
 
 
-def delete_intervention_impact(id: str):
-    response = get_supabase().table("intervention_impacts").delete().eq("id", id).execute()
+async def delete_intervention_impact(id: str):
+    supabase = await get_async_supabase()
+    response = await supabase.table("intervention_impacts").delete().eq("id", id).execute()
     return response.data
 
 
-def get_impacts_by_intervention(
+async def get_impacts_by_intervention(
     intervention_id: UUID, 
     skip: int = 0, 
-    limit: int = 100
-) -> List[InterventionImpact]:
+    limit: int = 100,
+    after: Optional[Tuple[Any, str]] = None
+) -> List[Dict[str, Any]]:
     """Get all impacts for a specific intervention"""
-    return get_supabase().table("intervention_impacts").select("*").eq("intervention_id", intervention_id).order_by("timestamp", desc=True).offset(skip).limit(limit).execute().data
+    supabase = await get_async_supabase()
+    query = supabase.table("intervention_impacts").select(SUMMARY_COLUMNS).eq("intervention_id", str(intervention_id))
+    response = await _page(query, "timestamp", skip, limit, after).execute()
+    return response.data
 
 
-def get_impacts_by_grid_cell(
+async def get_impacts_by_grid_cell(
     grid_cell_id: UUID, 
     skip: int = 0, 
     limit: int = 100,
     start_time: Optional[datetime] = None,
-    end_time: Optional[datetime] = None
-) -> List[InterventionImpact]:
+    end_time: Optional[datetime] = None,
+    after: Optional[Tuple[Any, str]] = None
+) -> List[Dict[str, Any]]:
     """Get impacts for a specific grid cell with optional time filtering"""
-    query = get_supabase().table("intervention_impacts").select("*").eq("grid_cell_id", grid_cell_id)
+    supabase = await get_async_supabase()
+    query = supabase.table("intervention_impacts").select(SUMMARY_COLUMNS).eq("grid_cell_id", str(grid_cell_id))
     
     if start_time:
-        query = query.filter("timestamp >= ?", start_time)
+        query = query.gte("timestamp", start_time.isoformat())
     if end_time:
-        query = query.filter("timestamp <= ?", end_time)
+        query = query.lte("timestamp", end_time.isoformat())
     
-    return query.order_by("timestamp", desc=True).offset(skip).limit(limit).execute().data
+    response = await _page(query, "timestamp", skip, limit, after).execute()
+    return response.data
 
 
-def get_impacts_by_effectiveness_range(
+async def get_impacts_by_effectiveness_range(
     min_effectiveness: float,
     max_effectiveness: float,
     skip: int = 0,
-    limit: int = 100
-) -> List[InterventionImpact]:
+    limit: int = 100,
+    after: Optional[Tuple[Any, str]] = None
+) -> List[Dict[str, Any]]:
     """Get impacts within a specific effectiveness range"""
-    return get_supabase().table("intervention_impacts").select("*").filter(
-        "effectiveness_score >= ? AND effectiveness_score <= ?",
-        min_effectiveness,
-        max_effectiveness
-    ).order_by("effectiveness_score", desc=True).offset(skip).limit(limit).execute().data
+    supabase = await get_async_supabase()
+    query = supabase.table("intervention_impacts").select(SUMMARY_COLUMNS).gte(
+        "effectiveness_score", min_effectiveness
+    ).lte(
+        "effectiveness_score", max_effectiveness
+    )
+    response = await _page(query, "effectiveness_score", skip, limit, after).execute()
+    return response.data
 
 
-def get_impact_statistics(
+async def get_impact_statistics(
     intervention_id: Optional[UUID] = None,
     grid_cell_id: Optional[UUID] = None,
     start_time: Optional[datetime] = None,
     end_time: Optional[datetime] = None
 ) -> Dict[str, Any]:
-    """Get statistics for intervention impacts"""
-    query = get_supabase().table("intervention_impacts").select("*")
-    
-    if intervention_id:
-        query = query.filter("intervention_id = ?", intervention_id)
-    if grid_cell_id:
-        query = query.filter("grid_cell_id = ?", grid_cell_id)
-    if start_time:
-        query = query.filter("timestamp >= ?", start_time)
-    if end_time:
-        query = query.filter("timestamp <= ?", end_time)
-    
-    stats = {
-        "total_impacts": query.count(),
-        "avg_effectiveness": query.with_entities(func.avg("effectiveness_score")).scalar(),
-        "avg_confidence": query.with_entities(func.avg("confidence_level")).scalar(),
-        "avg_temperature_change": query.with_entities(func.avg("temperature_change")).scalar(),
-        "avg_cost_per_degree": query.with_entities(func.avg("cost_per_degree")).scalar(),
-        "avg_efficiency_ratio": query.with_entities(func.avg("efficiency_ratio")).scalar(),
-        "avg_environmental_impact": query.with_entities(func.avg("environmental_impact_score")).scalar(),
-    }
+    """Get statistics for intervention impacts, aggregated by the impact_statistics SQL function"""
+    params = rpc_params(
+        intervention_id=intervention_id,
+        grid_cell_id=grid_cell_id,
+        start_time=start_time,
+        end_time=end_time
+    )
     
-    return stats
+    supabase = await get_async_supabase()
+    response = await supabase.rpc("impact_statistics", params).execute()
+    return response.data[0]
 
 
-def get_best_performing_impacts(
+async def get_best_performing_impacts(
     limit: int = 10,
     intervention_id: Optional[UUID] = None,
     grid_cell_id: Optional[UUID] = None
-) -> List[InterventionImpact]:
+) -> List[Dict[str, Any]]:
     """Get the best performing impacts based on effectiveness score"""
-    query = get_supabase().table("intervention_impacts").select("*").filter(
-        "effectiveness_score IS NOT NULL"
-    )
+    supabase = await get_async_supabase()
+    query = supabase.table("intervention_impacts").select(SUMMARY_COLUMNS).not_.is_("effectiveness_score", "null")
     
     if intervention_id:
-        query = query.filter("intervention_id = ?", intervention_id)
+        query = query.eq("intervention_id", str(intervention_id))
     if grid_cell_id:
-        query = query.filter("grid_cell_id = ?", grid_cell_id)
+        query = query.eq("grid_cell_id", str(grid_cell_id))
     
-    return query.order_by("effectiveness_score", desc=True).limit(limit).execute().data
+    response = await query.order("effectiveness_score", desc=True).limit(limit).execute()
+    return response.data
 
 
-def get_impact_list(
+async def get_impact_list(
     skip: int = 0, 
     limit: int = 100,
     intervention_id: Optional[UUID] = None,
     grid_cell_id: Optional[UUID] = None,
     start_time: Optional[datetime] = None,
     end_time: Optional[datetime] = None,
-    min_effectiveness: Optional[float] = None
-) -> List[InterventionImpact]:
+    min_effectiveness: Optional[float] = None,
+    after: Optional[Tuple[Any, str]] = None
+) -> List[Dict[str, Any]]:
     """Get list of intervention impacts with optional filters"""
-    query = get_supabase().table("intervention_impacts").select("*")
-    
-    if intervention_id:
-        query = query.filter("intervention_id = ?", intervention_id)
-    if grid_cell_id:
-        query = query.filter("grid_cell_id = ?", grid_cell_id)
-    if start_time:
-        query = query.filter("timestamp >= ?", start_time)
-    if end_time:
-        query = query.filter("timestamp <= ?", end_time)
-    if min_effectiveness is not None:
-        query = query.filter("effectiveness_score >= ?", min_effectiveness)
-    
-    return query.order_by("timestamp", desc=True).offset(skip).limit(limit).execute().data 
\ No newline at end of file
+    supabase = await get_async_supabase()
+    query = _filter(
+        supabase.table("intervention_impacts").select(SUMMARY_COLUMNS),
+        intervention_id, grid_cell_id, start_time, end_time, min_effectiveness
+    )
+    response = await _page(query, "timestamp", skip, limit, after).execute()
+    return response.data
+
+
+async def get_enriched_impact_list(
+    skip: int = 0, 
+    limit: int = 100,
+    intervention_id: Optional[UUID] = None,
+    grid_cell_id: Optional[UUID] = None,
+    start_time: Optional[datetime] = None,
+    end_time: Optional[datetime] = None,
+    min_effectiveness: Optional[float] = None,
+    after: Optional[Tuple[Any, str]] = None
+) -> List[Dict[str, Any]]:
+    """Get impacts with their intervention's name, type and location in one query"""
+    supabase = await get_async_supabase()
+    query = _filter(
+        supabase.table("intervention_impacts_enriched").select(ENRICHED_COLUMNS),
+        intervention_id, grid_cell_id, start_time, end_time, min_effectiveness
+    )
+    response = await _page(query, "timestamp", skip, limit, after).execute()
+    return response.data
+ 
\ No newline at end of file
@@ -1,103 +1,128 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Sequence, Tuple
 from uuid import UUID
-# TODO: Refactor this CRUD module for Supabase. All SQLAlchemy code removed.
 
 from app.schemas.optimization_result import OptimizationResult
-from app.schemas.optimization_result import OptimizationResultCreate, OptimizationResultUpdate
-from app.core.supabase_client import get_supabase
+from app.schemas.optimization_result import OptimizationResultCreate, OptimizationResultUpdate, OptimizationResultSummary
+from app.core.cache import ttl_cache
+from app.core.pagination import paginate
+from app.core.supabase_client import get_async_supabase, rpc_params
 
+# Single results are re-read often (detail views, polling); writes in this process evict
+# their entry, other workers may serve a row up to this many seconds old
+BY_ID_TTL = 30
 
-def create_optimization_result(data: dict):
-    response = get_supabase().table("optimization_results").insert(data).execute()
-    return response.data
+# List endpoints skip the JSON detail columns (inputs, parameters, analyses)
+SUMMARY_COLUMNS = ", ".join(OptimizationResultSummary.model_fields)
 
 
-def get_optimization_result_by_id(id: str):
-    response = get_supabase().table("optimization_results").select("*").eq("id", id).single().execute()
-    return response.data
+def _page(query, skip: int, limit: int, after: Optional[Tuple[Any, str]]):
+    """Newest first, with id as the tiebreak"""
+    return paginate(query, "timestamp", skip, limit, after, desc=True)
 
 
-def update_optimization_result(id: str, data: dict):
-    response = get_supabase().table("optimization_results").update(data).eq("id", id).execute()
-    return response.data
+def _match(query, column: str, values: Optional[Sequence[Any]]):
+    """Filter `column` to any of `values`; one value stays a plain equality so the column's index applies"""
+    if not values:
+        return query
+    values = [str(v) for v in values]
+    return query.eq(column, values[0]) if len(values) == 1 else query.in_(column, values)
 
 
-def delete_optimization_result(id: str):
-    response = get_supabase().table("optimization_results").delete().eq("id", id).execute()
+async def create_optimization_result(data: dict):
+    supabase = await get_async_supabase()
+    response = await supabase.table("optimization_results").insert(data).execute()
     return response.data
 
 
-def get_optimization_results_by_operator(operator_id: UUID, skip: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
-    response = get_supabase().table("optimization_results").select("*").eq("operator_id", str(operator_id)).order_by("timestamp", desc=True).range(skip, skip+limit-1).execute()
+async def create_optimization_results(objs_in: List[OptimizationResultCreate]):
+    """Insert several rows with a single statement"""
+    rows = [obj_in.model_dump(mode="json", exclude_none=True) for obj_in in objs_in]
+    supabase = await get_async_supabase()
+    response = await supabase.table("optimization_results").insert(rows).execute()
     return response.data
 
 
-def get_optimization_results_by_grid_cell(grid_cell_id: UUID, skip: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
-    response = get_supabase().table("optimization_results").select("*").eq("grid_cell_id", str(grid_cell_id)).order_by("timestamp", desc=True).range(skip, skip+limit-1).execute()
-    return response.data
+@ttl_cache(ttl=BY_ID_TTL, maxsize=10_000)
+async def get_optimization_result_by_id(id: str):
+    supabase = await get_async_supabase()
+    response = await supabase.table("optimization_results").select("*").eq("id", id).maybe_single().execute()
+    return response.data if response else None
 
 
-def get_optimization_results_by_type(optimization_type: str, skip: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
-    response = get_supabase().table("optimization_results").select("*").eq("optimization_type", optimization_type).order_by("timestamp", desc=True).range(skip, skip+limit-1).execute()
-    return response.data
+async def get_optimization_results_by_ids(ids: Sequence[UUID]) -> List[Dict[str, Any]]:
+    """Get several rows with one IN query, in the order of `ids`; unknown ids are left out"""
+    keys = list(dict.fromkeys(str(id) for id in ids))
+    supabase = await get_async_supabase()
+    response = await supabase.table("optimization_results").select("*").in_("id", keys).execute()
+    rows = {row["id"]: row for row in response.data}
+    return [rows[key] for key in keys if key in rows]
+
 
+async def get_optimization_result_version(id: str):
+    """Get only the id and updated_at of a row, for conditional GETs"""
+    supabase = await get_async_supabase()
+    response = await supabase.table("optimization_results").select("id, updated_at").eq("id", id).limit(1).execute()
+    return response.data[0] if response.data else None
 
-def get_optimization_results_by_algorithm(algorithm: str, skip: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
-    response = get_supabase().table("optimization_results").select("*").eq("algorithm", algorithm).order_by("timestamp", desc=True).range(skip, skip+limit-1).execute()
+
+async def update_optimization_result(id: str, data: dict):
+    supabase = await get_async_supabase()
+    response = await supabase.table("optimization_results").update(data).eq("id", id).execute()
+    get_optimization_result_by_id.cache_pop(id)
     return response.data
 
 
-def get_optimization_results_by_status(status: str, skip: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
-    response = get_supabase().table("optimization_results").select("*").eq("status", status).order_by("timestamp", desc=True).range(skip, skip+limit-1).execute()
+async def delete_optimization_result(id: str):
+    supabase = await get_async_supabase()
+    response = await supabase.table("optimization_results").delete().eq("id", id).execute()
+    get_optimization_result_by_id.cache_pop(id)
     return response.data
 
 
-def get_best_optimization_results(limit: int = 10, optimization_type: Optional[str] = None, grid_cell_id: Optional[UUID] = None) -> List[Dict[str, Any]]:
-    query = get_supabase().table("optimization_results").select("*").neq("objective_value", None).eq("status", "completed")
+async def get_best_optimization_results(limit: int = 10, optimization_type: Optional[str] = None, grid_cell_id: Optional[UUID] = None) -> List[Dict[str, Any]]:
+    supabase = await get_async_supabase()
+    query = supabase.table("optimization_results").select(SUMMARY_COLUMNS).not_.is_("objective_value", "null").eq("status", "completed")
     if optimization_type:
         query = query.eq("optimization_type", optimization_type)
     if grid_cell_id:
         query = query.eq("grid_cell_id", str(grid_cell_id))
-    response = query.order_by("objective_value", desc=True).limit(limit).execute()
+    response = await query.order("objective_value", desc=True).limit(limit).execute()
     return response.data
 
 
-def get_optimization_statistics(operator_id: Optional[UUID] = None, grid_cell_id: Optional[UUID] = None, optimization_type: Optional[str] = None, algorithm: Optional[str] = None) -> Dict[str, Any]:
-    query = get_supabase().table("optimization_results").select("*")
-    if operator_id:
-        query = query.eq("operator_id", str(operator_id))
-    if grid_cell_id:
-        query = query.eq("grid_cell_id", str(grid_cell_id))
-    if optimization_type:
-        query = query.eq("optimization_type", optimization_type)
-    if algorithm:
-        query = query.eq("algorithm", algorithm)
-    response = query.execute()
-    data = response.data or []
-    stats = {
-        "total_results": len(data),
-        "completed_results": len([r for r in data if r.get("status") == "completed"]),
-        "failed_results": len([r for r in data if r.get("status") == "failed"]),
-        "running_results": len([r for r in data if r.get("status") == "running"]),
-        "avg_execution_time": sum(r.get("execution_time", 0) for r in data if r.get("execution_time") is not None) / len(data) if data else 0,
-        "avg_iterations": sum(r.get("iterations", 0) for r in data if r.get("iterations") is not None) / len(data) if data else 0,
-        "avg_validation_score": sum(r.get("validation_score", 0) for r in data if r.get("validation_score") is not None) / len(data) if data else 0,
-        "best_objective_value": max((r.get("objective_value", float('-inf')) for r in data if r.get("objective_value") is not None), default=None),
-    }
-    return stats
-
-
-def get_optimization_result_list(skip: int = 0, limit: int = 100, operator_id: Optional[UUID] = None, grid_cell_id: Optional[UUID] = None, optimization_type: Optional[str] = None, algorithm: Optional[str] = None, status: Optional[str] = None) -> List[Dict[str, Any]]:
-    query = get_supabase().table("optimization_results").select("*")
-    if operator_id:
-        query = query.eq("operator_id", str(operator_id))
-    if grid_cell_id:
-        query = query.eq("grid_cell_id", str(grid_cell_id))
-    if optimization_type:
-        query = query.eq("optimization_type", optimization_type)
-    if algorithm:
-        query = query.eq("algorithm", algorithm)
-    if status:
-        query = query.eq("status", status)
-    response = query.order_by("timestamp", desc=True).range(skip, skip+limit-1).execute()
-    return response.data 
\ No newline at end of file
+async def get_optimization_statistics(operator_id: Optional[UUID] = None, grid_cell_id: Optional[UUID] = None, optimization_type: Optional[str] = None, algorithm: Optional[str] = None) -> Dict[str, Any]:
+    """Get statistics for optimization results, aggregated by the optimization_statistics SQL function"""
+    params = rpc_params(
+        operator_id=operator_id,
+        grid_cell_id=grid_cell_id,
+        optimization_type=optimization_type,
+        algorithm=algorithm
+    )
+    supabase = await get_async_supabase()
+    response = await supabase.rpc("optimization_statistics", params).execute()
+    return response.data[0]
+
+
+async def get_optimization_result_list(
+    skip: int = 0,
+    limit: int = 100,
+    operator_ids: Optional[Sequence[UUID]] = None,
+    grid_cell_ids: Optional[Sequence[UUID]] = None,
+    optimization_types: Optional[Sequence[str]] = None,
+    algorithms: Optional[Sequence[str]] = None,
+    statuses: Optional[Sequence[str]] = None,
+    after: Optional[Tuple[Any, str]] = None
+) -> List[Dict[str, Any]]:
+    """
+    List optimization results, newest first. Each filter takes one or more values,
+    so a dashboard can fetch several operators' or grid cells' results in one query.
+    """
+    supabase = await get_async_supabase()
+    query = supabase.table("optimization_results").select(SUMMARY_COLUMNS)
+    query = _match(query, "operator_id", operator_ids)
+    query = _match(query, "grid_cell_id", grid_cell_ids)
+    query = _match(query, "optimization_type", optimization_types)
+    query = _match(query, "algorithm", algorithms)
+    query = _match(query, "status", statuses)
+    response = await _page(query, skip, limit, after).execute()
+    return response.data
@@ -1,149 +1,184 @@
-# TODO: Refactor this CRUD module for Supabase. All SQLAlchemy code removed.
-
-from typing import List, Optional, Dict, Any
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, func
-from datetime import datetime, timedelta
+from typing import List, Optional, Dict, Any, Tuple, Sequence
+from datetime import datetime
 from uuid import UUID
 
 from app.schemas.satellite_data import SatelliteData
-from app.schemas.satellite_data import SatelliteDataCreate, SatelliteDataUpdate
-from app.core.supabase_client import get_supabase
+from app.schemas.satellite_data import SatelliteDataCreate, SatelliteDataUpdate, SatelliteDataSummary
+from app.core.cache import ttl_cache
+from app.core.pagination import paginate
+from app.core.supabase_client import get_async_supabase, rpc_params
 
+# Readings are looked up by id repeatedly; updates and deletes in this process evict
+# the entry, and the TTL bounds how stale another worker's copy can get
+BY_ID_TTL = 30
+
+# List endpoints skip the JSON columns (raw_data, quality_flags, uncertainty)
+SUMMARY_COLUMNS = ", ".join(SatelliteDataSummary.model_fields)
 
-def create_satellite_data(data: dict):
-    response = get_supabase().table("satellite_data").insert(data).execute()
-    return response.data
 
+def _page(query, skip: int, limit: int, after: Optional[Tuple[Any, str]]):
+    """Newest first, with id as the tiebreak"""
+    return paginate(query, "timestamp", skip, limit, after, desc=True)
 
-def get_satellite_data_by_id(id: str):
-    response = get_supabase().table("satellite_data").select("*").eq("id", id).single().execute()
+
+def _time_range(query, start_time: Optional[datetime], end_time: Optional[datetime]):
+    if start_time:
+        query = query.gte("timestamp", start_time.isoformat())
+    if end_time:
+        query = query.lte("timestamp", end_time.isoformat())
+    return query
+
+
+async def create_satellite_data(data: dict):
+    supabase = await get_async_supabase()
+    response = await supabase.table("satellite_data").insert(data).execute()
     return response.data
 
 
-def update_satellite_data(id: str, data: dict):
-    response = get_supabase().table("satellite_data").update(data).eq("id", id).execute()
+async def create_satellite_data_bulk(objs_in: List[SatelliteDataCreate], return_rows: bool = True):
+    """
+    Insert several readings with a single statement.
+    With return_rows=False PostgREST answers return=minimal and no rows come back,
+    which spares ingestion jobs from downloading every reading they just sent.
+    """
+    rows = [obj_in.model_dump(mode="json", exclude_none=True) for obj_in in objs_in]
+    supabase = await get_async_supabase()
+    returning = "representation" if return_rows else "minimal"
+    response = await supabase.table("satellite_data").insert(rows, returning=returning).execute()
     return response.data
 
 
-def delete_satellite_data(id: str):
-    response = get_supabase().table("satellite_data").delete().eq("id", id).execute()
+@ttl_cache(ttl=BY_ID_TTL, maxsize=10_000)
+async def get_satellite_data_by_id(id: str):
+    supabase = await get_async_supabase()
+    response = await supabase.table("satellite_data").select("*").eq("id", id).maybe_single().execute()
+    return response.data if response else None
+
+
+async def get_satellite_data_by_ids(ids: Sequence[UUID]) -> List[Dict[str, Any]]:
+    """Get several rows with one IN query, in the order of `ids`; unknown ids are left out"""
+    keys = list(dict.fromkeys(str(id) for id in ids))
+    supabase = await get_async_supabase()
+    response = await supabase.table("satellite_data").select("*").in_("id", keys).execute()
+    rows = {row["id"]: row for row in response.data}
+    return [rows[key] for key in keys if key in rows]
+
+
+async def update_satellite_data(id: str, data: dict):
+    supabase = await get_async_supabase()
+    response = await supabase.table("satellite_data").update(data).eq("id", id).execute()
+    get_satellite_data_by_id.cache_pop(id)
     return response.data
 
 
-def get_satellite_data(db: Session, satellite_data_id: UUID) -> Optional[SatelliteData]:
-    """Get satellite data by ID"""
-    return db.query(SatelliteData).filter(SatelliteData.id == satellite_data_id).first()
+async def delete_satellite_data(id: str):
+    supabase = await get_async_supabase()
+    response = await supabase.table("satellite_data").delete().eq("id", id).execute()
+    get_satellite_data_by_id.cache_pop(id)
+    return response.data
 
 
-def get_satellite_data_by_grid_cell(
-    db: Session, 
-    grid_cell_id: UUID, 
-    skip: int = 0, 
+async def get_satellite_data_by_grid_cell(
+    grid_cell_id: UUID,
+    skip: int = 0,
     limit: int = 100,
     start_time: Optional[datetime] = None,
-    end_time: Optional[datetime] = None
-) -> List[SatelliteData]:
+    end_time: Optional[datetime] = None,
+    after: Optional[Tuple[Any, str]] = None
+) -> List[Dict[str, Any]]:
     """Get satellite data for a specific grid cell with optional time filtering"""
-    query = db.query(SatelliteData).filter(SatelliteData.grid_cell_id == grid_cell_id)
-    
-    if start_time:
-        query = query.filter(SatelliteData.timestamp >= start_time)
-    if end_time:
-        query = query.filter(SatelliteData.timestamp <= end_time)
-    
-    return query.order_by(SatelliteData.timestamp.desc()).offset(skip).limit(limit).all()
+    supabase = await get_async_supabase()
+    query = supabase.table("satellite_data").select(SUMMARY_COLUMNS).eq("grid_cell_id", str(grid_cell_id))
+    query = _time_range(query, start_time, end_time)
+    response = await _page(query, skip, limit, after).execute()
+    return response.data
 
 
-def get_satellite_data_by_satellite(
-    db: Session, 
-    satellite_id: str, 
-    skip: int = 0, 
-    limit: int = 100
-) -> List[SatelliteData]:
+async def get_satellite_data_by_satellite(
+    satellite_id: str,
+    skip: int = 0,
+    limit: int = 100,
+    after: Optional[Tuple[Any, str]] = None
+) -> List[Dict[str, Any]]:
     """Get satellite data by satellite ID"""
-    return db.query(SatelliteData).filter(
-        SatelliteData.satellite_id == satellite_id
-    ).order_by(SatelliteData.timestamp.desc()).offset(skip).limit(limit).all()
+    supabase = await get_async_supabase()
+    query = supabase.table("satellite_data").select(SUMMARY_COLUMNS).eq("satellite_id", satellite_id)
+    response = await _page(query, skip, limit, after).execute()
+    return response.data
 
 
-def get_satellite_data_by_time_range(
-    db: Session,
+async def get_satellite_data_by_time_range(
     start_time: datetime,
     end_time: datetime,
     skip: int = 0,
-    limit: int = 100
-) -> List[SatelliteData]:
+    limit: int = 100,
+    after: Optional[Tuple[Any, str]] = None
+) -> List[Dict[str, Any]]:
     """Get satellite data within a time range"""
-    return db.query(SatelliteData).filter(
-        and_(
-            SatelliteData.timestamp >= start_time,
-            SatelliteData.timestamp <= end_time
-        )
-    ).order_by(SatelliteData.timestamp.desc()).offset(skip).limit(limit).all()
-
-
-def get_latest_satellite_data_by_grid_cell(
-    db: Session, 
-    grid_cell_id: UUID
-) -> Optional[SatelliteData]:
+    supabase = await get_async_supabase()
+    query = _time_range(supabase.table("satellite_data").select(SUMMARY_COLUMNS), start_time, end_time)
+    response = await _page(query, skip, limit, after).execute()
+    return response.data
+
+
+async def get_latest_satellite_data_by_grid_cell(grid_cell_id: UUID) -> Optional[Dict[str, Any]]:
     """Get the latest satellite data for a grid cell"""
-    return db.query(SatelliteData).filter(
-        SatelliteData.grid_cell_id == grid_cell_id
-    ).order_by(SatelliteData.timestamp.desc()).first()
+    supabase = await get_async_supabase()
+    response = await supabase.table("satellite_data").select("*").eq(
+        "grid_cell_id", str(grid_cell_id)
+    ).order("timestamp", desc=True).limit(1).execute()
+    return response.data[0] if response.data else None
 
 
-def get_satellite_data_statistics(
-    db: Session,
+async def get_latest_satellite_data_per_grid_cell(
+    skip: int = 0,
+    limit: int = 100,
+    after: Optional[Tuple[Any, str]] = None
+) -> List[Dict[str, Any]]:
+    """Get the latest satellite data of every grid cell, ordered by grid cell"""
+    supabase = await get_async_supabase()
+    query = supabase.table("latest_satellite_data").select(SUMMARY_COLUMNS)
+    response = await paginate(query, "grid_cell_id", skip, limit, after).execute()
+    return response.data
+
+
+async def get_satellite_data_statistics(
     grid_cell_id: Optional[UUID] = None,
     satellite_id: Optional[str] = None,
     start_time: Optional[datetime] = None,
     end_time: Optional[datetime] = None
 ) -> Dict[str, Any]:
-    """Get statistics for satellite data"""
-    query = db.query(SatelliteData)
-    
-    if grid_cell_id:
-        query = query.filter(SatelliteData.grid_cell_id == grid_cell_id)
-    if satellite_id:
-        query = query.filter(SatelliteData.satellite_id == satellite_id)
-    if start_time:
-        query = query.filter(SatelliteData.timestamp >= start_time)
-    if end_time:
-        query = query.filter(SatelliteData.timestamp <= end_time)
-    
-    stats = {
-        "total_records": query.count(),
-        "avg_temperature": query.with_entities(func.avg(SatelliteData.temperature)).scalar(),
-        "avg_humidity": query.with_entities(func.avg(SatelliteData.humidity)).scalar(),
-        "avg_pressure": query.with_entities(func.avg(SatelliteData.pressure)).scalar(),
-        "avg_co2": query.with_entities(func.avg(SatelliteData.co2_concentration)).scalar(),
-        "avg_aod": query.with_entities(func.avg(SatelliteData.aerosol_optical_depth)).scalar(),
-        "data_quality_avg": query.with_entities(func.avg(SatelliteData.data_quality)).scalar(),
-    }
-    
-    return stats
-
-
-def get_satellite_data_list(
-    db: Session, 
-    skip: int = 0, 
+    """Get statistics for satellite data, aggregated by the satellite_data_statistics SQL function"""
+    params = rpc_params(
+        grid_cell_id=grid_cell_id,
+        satellite_id=satellite_id,
+        start_time=start_time,
+        end_time=end_time
+    )
+
+    supabase = await get_async_supabase()
+    response = await supabase.rpc("satellite_data_statistics", params).execute()
+    return response.data[0]
+
+
+async def get_satellite_data_list(
+    skip: int = 0,
     limit: int = 100,
     grid_cell_id: Optional[UUID] = None,
     satellite_id: Optional[str] = None,
     start_time: Optional[datetime] = None,
-    end_time: Optional[datetime] = None
-) -> List[SatelliteData]:
+    end_time: Optional[datetime] = None,
+    after: Optional[Tuple[Any, str]] = None
+) -> List[Dict[str, Any]]:
     """Get list of satellite data with optional filters"""
-    query = db.query(SatelliteData)
-    
+    supabase = await get_async_supabase()
+    query = supabase.table("satellite_data").select(SUMMARY_COLUMNS)
+
     if grid_cell_id:
-        query = query.filter(SatelliteData.grid_cell_id == grid_cell_id)
+        query = query.eq("grid_cell_id", str(grid_cell_id))
     if satellite_id:
-        query = query.filter(SatelliteData.satellite_id == satellite_id)
-    if start_time:
-        query = query.filter(SatelliteData.timestamp >= start_time)
-    if end_time:
-        query = query.filter(SatelliteData.timestamp <= end_time)
-    
-    return query.order_by(SatelliteData.timestamp.desc()).offset(skip).limit(limit).all() 
\ No newline at end of file
+        query = query.eq("satellite_id", satellite_id)
+    query = _time_range(query, start_time, end_time)
+
+    response = await _page(query, skip, limit, after).execute()
+    return response.data
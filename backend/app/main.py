@@ -1,8 +1,40 @@
+import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
+from starlette.concurrency import run_in_threadpool
 
 from app.api.api_v1.api import api_router
+from app.core.concurrency_limit import ConcurrencyLimitMiddleware
+from app.core.redis_client import close_redis
+from app.core.supabase_client import (
+    close_async_supabase,
+    init_async_supabase,
+    warm_up_async_supabase,
+    warm_up_supabase,
+)
+from app.services.nasa_services import nasa_services
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm up the Supabase connections on startup and release pooled upstream connections on shutdown"""
+    await init_async_supabase()
+    try:
+        await run_in_threadpool(warm_up_supabase)
+        await warm_up_async_supabase()
+    except Exception:
+        logger.warning("Supabase warm-up failed; the first request will open the connection", exc_info=True)
+    yield
+    await nasa_services.aclose()
+    await close_async_supabase()
+    await close_redis()
+
 
 # Create FastAPI app
 app = FastAPI(
@@ -10,9 +42,15 @@ app = FastAPI(
     description="API for managing climate intervention deployments and monitoring their impact",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
+# Per-client in-flight cap (off unless MAX_CONCURRENT_REQUESTS is set; see
+# TRUSTED_PROXIES when behind a proxy); added first so CORS wraps it and 429s carry CORS headers
+app.add_middleware(ConcurrencyLimitMiddleware)
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -20,8 +58,12 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "X-Cache", "ETag"],
 )
 
+# Compress larger payloads (historical series, optimization bundles, list pages)
+app.add_middleware(GZipMiddleware, minimum_size=500, compresslevel=5)
+
 # Include API router
 app.include_router(api_router, prefix="/api/v1")
 
@@ -45,10 +87,11 @@ async def health_check():
 
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
-    """Global exception handler"""
+    """Global exception handler; details stay in the log rather than the response"""
+    logger.error("Unhandled error on %s %s", request.method, request.url.path, exc_info=exc)
     return JSONResponse(
         status_code=500,
-        content={"detail": "Internal server error"}
+        content={"success": False, "error": "Internal server error"}
     )
 
 
@@ -79,4 +79,32 @@ class DataSourceInDB(DataSourceBase):
 
 
 class DataSource(DataSourceInDB):
-    pass 
\ No newline at end of file
+    pass
+
+class DataSourceSummary(BaseModel):
+    """Scalar columns of a data source, returned by list endpoints; coverage, schema, config and headers are left to GET /{id}"""
+    id: UUID
+    name: str
+    description: Optional[str] = None
+    source_type: str
+    provider: Optional[str] = None
+    url: Optional[str] = None
+    api_endpoint: Optional[str] = None
+    data_format: Optional[str] = None
+    update_frequency: Optional[str] = None
+    spatial_resolution: Optional[float] = None
+    temporal_resolution: Optional[str] = None
+    data_quality_score: Optional[float] = None
+    reliability_score: Optional[float] = None
+    requires_authentication: bool = False
+    authentication_method: Optional[str] = None
+    cost_per_request: Optional[float] = None
+    cost_per_month: Optional[float] = None
+    licensing_terms: Optional[str] = None
+    api_version: Optional[str] = None
+    is_active: bool = True
+    last_successful_fetch: Optional[datetime] = None
+    last_error: Optional[str] = None
+    error_count: int
+    created_at: datetime
+    updated_at: datetime
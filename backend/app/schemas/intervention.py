@@ -64,10 +64,34 @@ class InterventionResponse(InterventionInDB):
     pass
 
 
+class InterventionSummary(BaseModel):
+    """Intervention without deployment_data, returned by the operator/type/status listings"""
+    id: UUID
+    operator_id: UUID
+    grid_cell_id: UUID
+    name: str
+    description: Optional[str] = None
+    intervention_type: str
+    status: str
+    latitude: float
+    longitude: float
+    region_name: Optional[str] = None
+    scale_amount: float
+    scale_unit: str
+    cost_usd: Optional[float] = None
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+    duration_months: Optional[int] = None
+    created_at: datetime
+    updated_at: datetime
+
+
 class InterventionListResponse(BaseModel):
     """Schema for paginated list of interventions"""
     interventions: list[InterventionResponse] = Field(..., description="List of interventions")
-    total: int = Field(..., description="Total number of interventions")
+    total: Optional[int] = Field(None, description="Total number of interventions; set on the last page or with include_total")
     page: int = Field(..., description="Current page number")
     size: int = Field(..., description="Number of items per page")
-    pages: int = Field(..., description="Total number of pages") 
\ No newline at end of file
+    pages: Optional[int] = Field(None, description="Total number of pages; set whenever total is")
+    has_more: bool = Field(False, description="Whether another page follows this one")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page, if there is one")
\ No newline at end of file
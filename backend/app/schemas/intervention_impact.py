@@ -1,6 +1,6 @@
 from datetime import datetime
 from typing import Optional, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 from uuid import UUID
 
 
@@ -69,4 +69,51 @@ class InterventionImpactInDB(InterventionImpactBase):
 
 
 class InterventionImpact(InterventionImpactInDB):
-    pass 
\ No newline at end of file
+    pass
+
+
+class InterventionImpactSummary(BaseModel):
+    """Scalar columns of an impact, returned by list endpoints; JSON detail columns are left to GET /{id}"""
+    id: UUID
+    intervention_id: UUID
+    grid_cell_id: UUID
+    timestamp: datetime
+    temperature_change: Optional[float] = None
+    humidity_change: Optional[float] = None
+    pressure_change: Optional[float] = None
+    wind_speed_change: Optional[float] = None
+    aerosol_optical_depth_change: Optional[float] = None
+    co2_concentration_change: Optional[float] = None
+    methane_concentration_change: Optional[float] = None
+    solar_irradiance_change: Optional[float] = None
+    albedo_change: Optional[float] = None
+    effectiveness_score: Optional[float] = None
+    confidence_level: Optional[float] = None
+    cost_per_degree: Optional[float] = None
+    efficiency_ratio: Optional[float] = None
+    environmental_impact_score: Optional[float] = None
+    analysis_method: Optional[str] = None
+    validation_status: Optional[str] = None
+    peer_review_status: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+
+
+class InterventionImpactEnriched(InterventionImpactSummary):
+    """Impact summary with its intervention's name, type and location, from the intervention_impacts_enriched view"""
+    intervention_name: str
+    intervention_type: str
+    latitude: float
+    longitude: float
+
+
+class EffectivenessRangeParams(BaseModel):
+    """Query parameters for the effectiveness-range listing"""
+    min_effectiveness: float = Field(..., ge=0, le=1)
+    max_effectiveness: float = Field(..., ge=0, le=1)
+
+    @model_validator(mode="after")
+    def check_range(self) -> "EffectivenessRangeParams":
+        if self.min_effectiveness > self.max_effectiveness:
+            raise ValueError("min_effectiveness must be less than or equal to max_effectiveness")
+        return self
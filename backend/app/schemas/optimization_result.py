@@ -77,4 +77,25 @@ class OptimizationResultInDB(OptimizationResultBase):
 
 
 class OptimizationResult(OptimizationResultInDB):
-    pass 
\ No newline at end of file
+    pass
+
+
+class OptimizationResultSummary(BaseModel):
+    """Scalar columns of a result, returned by list endpoints; JSON detail columns are left to GET /{id}"""
+    id: UUID
+    operator_id: UUID
+    grid_cell_id: UUID
+    timestamp: datetime
+    optimization_type: str
+    algorithm: str
+    objective_value: Optional[float] = None
+    convergence_status: Optional[str] = None
+    execution_time: Optional[float] = None
+    iterations: Optional[int] = None
+    validation_score: Optional[float] = None
+    cross_validation_score: Optional[float] = None
+    model_version: Optional[str] = None
+    status: str = "completed"
+    error_message: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
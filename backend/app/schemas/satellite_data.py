@@ -61,4 +61,28 @@ class SatelliteDataInDB(SatelliteDataBase):
 
 
 class SatelliteData(SatelliteDataInDB):
-    pass 
\ No newline at end of file
+    pass 
+
+
+class SatelliteDataSummary(BaseModel):
+    """Scalar columns of a reading, returned by list endpoints; raw data and JSON flags are left to GET /{id}"""
+    id: UUID
+    grid_cell_id: UUID
+    timestamp: datetime
+    temperature: Optional[float] = None
+    humidity: Optional[float] = None
+    pressure: Optional[float] = None
+    wind_speed: Optional[float] = None
+    wind_direction: Optional[float] = None
+    precipitation: Optional[float] = None
+    aerosol_optical_depth: Optional[float] = None
+    co2_concentration: Optional[float] = None
+    methane_concentration: Optional[float] = None
+    solar_irradiance: Optional[float] = None
+    albedo: Optional[float] = None
+    satellite_id: str
+    instrument: Optional[str] = None
+    data_quality: Optional[float] = None
+    processing_level: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
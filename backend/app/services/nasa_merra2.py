@@ -1,4 +1,5 @@
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
 import netCDF4 as nc
 import numpy as np
@@ -10,6 +11,11 @@ NASA_PASSWORD = os.getenv("NASA_EARTHDATA_PASSWORD")
 
 MERRA2_BASE_URL = "https://goldsmr5.gesdisc.eosdis.nasa.gov/opendap/MERRA2/M2T1NXAER.5.12.4"
 
+# Reuse one authenticated session so the day-by-day fallback loop keeps its connection alive
+session = requests.Session()
+session.auth = HTTPBasicAuth(NASA_USERNAME, NASA_PASSWORD)
+session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
 # MERRA-2 file naming convention: MERRA2_400.tavg1_2d_aer_Nx.YYYYMMDD.nc4
 # We'll use collection 400 (post-2000)
 def get_merra2_url(date: datetime) -> str:
@@ -28,7 +34,7 @@ def fetch_merra2_file(date: datetime, max_days_back: int = 7) -> str:
         try_date = date - timedelta(days=i)
         url = get_merra2_url(try_date)
         print(f"Trying NASA MERRA-2 URL: {url}")
-        response = requests.get(url, auth=HTTPBasicAuth(NASA_USERNAME, NASA_PASSWORD))
+        response = session.get(url)
         if response.status_code == 200:
             local_file = f"/tmp/merra2_{try_date.strftime('%Y%m%d')}.nc4"
             with open(local_file, "wb") as f:
@@ -1,13 +1,21 @@
-import requests
+import asyncio
+import httpx
 import os
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 import json
 from dotenv import load_dotenv  # ADD THIS LINE
 
+from app.core.cache import ttl_cache
+
 # Load environment variables
 load_dotenv()  # ADD THIS LINE
 
+# Cache lifetimes (seconds) for upstream NASA lookups
+CURRENT_CONDITIONS_TTL = 15 * 60
+IMAGERY_TTL = 60 * 60
+HISTORICAL_TTL = 24 * 60 * 60
+
 class NASAServices:
     """Real NASA API integration for climate intervention coordination"""
     
@@ -21,10 +29,29 @@ class NASAServices:
         self.earth_api = f"{self.base_api}/planetary/earth"
         self.modis_api = f"{self.base_api}/MODIS_Aqua-C6-L2"
         
+        # Shared async client (created lazily) so concurrent NASA calls reuse keep-alive connections
+        self._client: Optional[httpx.AsyncClient] = None
+        
         if not self.nasa_api_key:
             print("Warning: NASA_API_KEY not found. Using mock data.")
     
-    def get_satellite_imagery(self, lat: float, lon: float, date: Optional[str] = None) -> Dict[str, Any]:
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=10,
+                limits=httpx.Limits(max_keepalive_connections=32)
+            )
+        return self._client
+    
+    async def aclose(self):
+        """Close the pooled HTTP client"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
+    @ttl_cache(ttl=IMAGERY_TTL)
+    async def get_satellite_imagery(self, lat: float, lon: float, date: Optional[str] = None) -> Dict[str, Any]:
         """Get actual satellite imagery from NASA"""
         try:
             if not self.nasa_api_key:
@@ -43,13 +70,13 @@ class NASAServices:
                 "api_key": self.nasa_api_key
             }
             
-            response = requests.get(url, params=params, timeout=10)
+            response = await self.client.get(url, params=params)
             
             if response.status_code == 200:
                 return {
                     "location": {"lat": lat, "lon": lon},
                     "date": date,
-                    "imagery_url": response.url,
+                    "imagery_url": str(response.url),
                     "status": "success",
                     "data_source": "NASA Landsat",
                     "timestamp": datetime.now().isoformat()
@@ -73,7 +100,7 @@ class NASAServices:
                 **self._mock_satellite_data(lat, lon, date)
             }
     
-    def get_earth_assets(self, lat: float, lon: float) -> Dict[str, Any]:
+    async def get_earth_assets(self, lat: float, lon: float) -> Dict[str, Any]:
         """Get available Earth observation assets for a location"""
         try:
             if not self.nasa_api_key:
@@ -88,7 +115,7 @@ class NASAServices:
                 "api_key": self.nasa_api_key
             }
             
-            response = requests.get(url, params=params, timeout=10)
+            response = await self.client.get(url, params=params)
             
             if response.status_code == 200:
                 data = response.json()
@@ -116,7 +143,8 @@ class NASAServices:
                 **self._mock_earth_assets(lat, lon)
             }
     
-    def get_co2_concentrations(self, lat: float, lon: float, date: Optional[str] = None) -> Dict[str, Any]:
+    @ttl_cache(ttl=CURRENT_CONDITIONS_TTL)
+    async def get_co2_concentrations(self, lat: float, lon: float, date: Optional[str] = None) -> Dict[str, Any]:
         """Get CO2 concentration data - enhanced with real API attempt"""
         try:
             # Note: NASA doesn't have a direct CO2 API in the basic tier
@@ -127,7 +155,7 @@ class NASAServices:
                 date = datetime.now().strftime("%Y-%m-%d")
             
             # Try to get real satellite imagery first to validate location
-            imagery_data = self.get_satellite_imagery(lat, lon, date)
+            imagery_data = await self.get_satellite_imagery(lat, lon, date)
             
             # Enhanced mock data based on actual location validation
             base_co2 = 415.0  # Current global average
@@ -153,14 +181,15 @@ class NASAServices:
         except Exception as e:
             return {"error": f"Failed to fetch CO2 data: {str(e)}"}
     
-    def get_temperature_data(self, lat: float, lon: float, date: Optional[str] = None) -> Dict[str, Any]:
+    @ttl_cache(ttl=CURRENT_CONDITIONS_TTL)
+    async def get_temperature_data(self, lat: float, lon: float, date: Optional[str] = None) -> Dict[str, Any]:
         """Get temperature data with real API integration attempt"""
         try:
             if not date:
                 date = datetime.now().strftime("%Y-%m-%d")
             
             # Validate location with real imagery API
-            imagery_data = self.get_satellite_imagery(lat, lon, date)
+            imagery_data = await self.get_satellite_imagery(lat, lon, date)
             
             # Enhanced temperature model based on location
             import math
@@ -189,11 +218,12 @@ class NASAServices:
         except Exception as e:
             return {"error": f"Failed to fetch temperature data: {str(e)}"}
     
-    def get_biomass_data(self, lat: float, lon: float, radius_km: float = 10) -> Dict[str, Any]:
+    @ttl_cache(ttl=CURRENT_CONDITIONS_TTL)
+    async def get_biomass_data(self, lat: float, lon: float, radius_km: float = 10) -> Dict[str, Any]:
         """Get biomass data with location validation"""
         try:
             # Validate location with real imagery
-            imagery_data = self.get_satellite_imagery(lat, lon)
+            imagery_data = await self.get_satellite_imagery(lat, lon)
             
             # Enhanced biomass model based on latitude and climate zone
             if abs(lat) < 10:  # Tropical
@@ -223,7 +253,8 @@ class NASAServices:
         except Exception as e:
             return {"error": f"Failed to fetch biomass data: {str(e)}"}
     
-    def get_historical_climate_patterns(self, lat: float, lon: float, years_back: int = 10) -> Dict[str, Any]:
+    @ttl_cache(ttl=HISTORICAL_TTL)
+    async def get_historical_climate_patterns(self, lat: float, lon: float, years_back: int = 10) -> Dict[str, Any]:
         """Get historical climate patterns"""
         try:
             end_date = datetime.now()
@@ -250,15 +281,19 @@ class NASAServices:
         except Exception as e:
             return {"error": f"Failed to fetch historical data: {str(e)}"}
     
-    def get_intervention_optimization_data(self, lat: float, lon: float) -> Dict[str, Any]:
+    @ttl_cache(ttl=HISTORICAL_TTL)
+    async def get_intervention_optimization_data(self, lat: float, lon: float) -> Dict[str, Any]:
         """Get comprehensive optimization data using real APIs where possible"""
         try:
             # Get all data components
-            co2_data = self.get_co2_concentrations(lat, lon)
-            temp_data = self.get_temperature_data(lat, lon)
-            biomass_data = self.get_biomass_data(lat, lon)
-            historical_data = self.get_historical_climate_patterns(lat, lon)
-            imagery_data = self.get_satellite_imagery(lat, lon)
+            # Components are independent, so fetch them concurrently over the shared client
+            co2_data, temp_data, biomass_data, historical_data, imagery_data = await asyncio.gather(
+                self.get_co2_concentrations(lat, lon),
+                self.get_temperature_data(lat, lon),
+                self.get_biomass_data(lat, lon),
+                self.get_historical_climate_patterns(lat, lon),
+                self.get_satellite_imagery(lat, lon)
+            )
             
             # Enhanced intervention logic
             co2_level = co2_data.get("co2_concentration", 415)
@@ -3,6 +3,7 @@
 Detailed NASA API test - shows exactly what's happening with API calls
 """
 
+import asyncio
 import os
 import sys
 import json
@@ -13,7 +14,7 @@ sys.path.append(os.path.join(os.path.dirname(__file__), 'app'))
 
 from services.nasa_services import nasa_services
 
-def detailed_nasa_test():
+async def detailed_nasa_test():
     """Test NASA API integration with detailed output"""
     print("🚀 Detailed NASA Integration Test for PTC Platform")
     print("=" * 60)
@@ -30,7 +31,7 @@ def detailed_nasa_test():
     
     # Test 1: Satellite Imagery (Real API call)
     print("1. 🛰️  Testing NASA Satellite Imagery API...")
-    imagery_data = nasa_services.get_satellite_imagery(test_lat, test_lon)
+    imagery_data = await nasa_services.get_satellite_imagery(test_lat, test_lon)
     print(f"   Status: {imagery_data.get('status', 'unknown')}")
     if 'imagery_url' in imagery_data:
         print(f"   📸 Imagery URL: {imagery_data['imagery_url']}")
@@ -41,7 +42,7 @@ def detailed_nasa_test():
     
     # Test 2: Earth Assets (Real API call)
     print("2. 🌍 Testing NASA Earth Assets API...")
-    assets_data = nasa_services.get_earth_assets(test_lat, test_lon)
+    assets_data = await nasa_services.get_earth_assets(test_lat, test_lon)
     print(f"   Status: {assets_data.get('status', 'unknown')}")
     if 'assets_count' in assets_data:
         print(f"   📦 Assets found: {assets_data['assets_count']}")
@@ -52,7 +53,7 @@ def detailed_nasa_test():
     
     # Test 3: CO2 Data (Enhanced with real validation)
     print("3. 🌡️  Testing CO2 concentration data...")
-    co2_data = nasa_services.get_co2_concentrations(test_lat, test_lon)
+    co2_data = await nasa_services.get_co2_concentrations(test_lat, test_lon)
     print(f"   CO2 Level: {co2_data.get('co2_concentration', 'N/A')} ppm")
     print(f"   Confidence: {co2_data.get('confidence', 'N/A')}")
     print(f"   Imagery Validated: {co2_data.get('imagery_validated', 'N/A')}")
@@ -61,7 +62,7 @@ def detailed_nasa_test():
     
     # Test 4: Temperature Data (Enhanced with real validation)
     print("4. 🌡️  Testing temperature data...")
-    temp_data = nasa_services.get_temperature_data(test_lat, test_lon)
+    temp_data = await nasa_services.get_temperature_data(test_lat, test_lon)
     print(f"   Temperature: {temp_data.get('temperature', 'N/A')}°C")
     print(f"   Anomaly: {temp_data.get('temperature_anomaly', 'N/A')}°C")
     print(f"   Confidence: {temp_data.get('confidence', 'N/A')}")
@@ -70,7 +71,7 @@ def detailed_nasa_test():
     
     # Test 5: Biomass Data (Enhanced with real validation)
     print("5. 🌿 Testing biomass data...")
-    biomass_data = nasa_services.get_biomass_data(test_lat, test_lon)
+    biomass_data = await nasa_services.get_biomass_data(test_lat, test_lon)
     print(f"   Biomass Density: {biomass_data.get('biomass_density', 'N/A')} tons/ha")
     print(f"   Vegetation Type: {biomass_data.get('vegetation_type', 'N/A')}")
     print(f"   Confidence: {biomass_data.get('confidence', 'N/A')}")
@@ -79,7 +80,7 @@ def detailed_nasa_test():
     
     # Test 6: Comprehensive Optimization
     print("6. 🎯 Testing comprehensive optimization...")
-    optimization_data = nasa_services.get_intervention_optimization_data(test_lat, test_lon)
+    optimization_data = await nasa_services.get_intervention_optimization_data(test_lat, test_lon)
     recommendations = optimization_data.get('intervention_recommendations', {})
     print(f"   Optimal Intervention: {recommendations.get('optimal_intervention_type', 'N/A')}")
     print(f"   Priority: {recommendations.get('deployment_priority', 'N/A')}")
@@ -114,4 +115,4 @@ def detailed_nasa_test():
     print("• Location validation for deployment decisions")
 
 if __name__ == "__main__":
-    detailed_nasa_test()
\ No newline at end of file
+    asyncio.run(detailed_nasa_test())
\ No newline at end of file
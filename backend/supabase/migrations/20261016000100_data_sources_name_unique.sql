@@ -0,0 +1,3 @@
+-- Data source names are unique so creates can use INSERT ... ON CONFLICT (name) DO NOTHING
+-- instead of a separate lookup-by-name round-trip.
+ALTER TABLE data_sources ADD CONSTRAINT data_sources_name_key UNIQUE (name);
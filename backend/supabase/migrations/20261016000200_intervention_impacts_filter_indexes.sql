@@ -0,0 +1,10 @@
+-- Composite indexes matching the intervention impact list filters, so the
+-- equality + time-range / effectiveness predicates resolve with an index scan.
+CREATE INDEX IF NOT EXISTS idx_impacts_intervention_time
+    ON intervention_impacts (intervention_id, "timestamp" DESC);
+
+CREATE INDEX IF NOT EXISTS idx_impacts_grid_cell_time
+    ON intervention_impacts (grid_cell_id, "timestamp" DESC);
+
+CREATE INDEX IF NOT EXISTS idx_impacts_intervention_effectiveness
+    ON intervention_impacts (intervention_id, effectiveness_score DESC);
@@ -0,0 +1,24 @@
+-- Composite indexes for the optimization result and intervention list endpoints.
+-- Each list filters on one equality column and pages on ("timestamp", id) DESC,
+-- so the index leads with the filter column and carries the keyset order.
+CREATE INDEX IF NOT EXISTS idx_optimization_results_operator_time
+    ON optimization_results (operator_id, "timestamp" DESC, id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_optimization_results_grid_cell_time
+    ON optimization_results (grid_cell_id, "timestamp" DESC, id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_optimization_results_type_time
+    ON optimization_results (optimization_type, "timestamp" DESC, id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_optimization_results_algorithm_time
+    ON optimization_results (algorithm, "timestamp" DESC, id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_optimization_results_status_time
+    ON optimization_results (status, "timestamp" DESC, id DESC);
+
+-- Unfiltered pages of the optimization result and intervention lists
+CREATE INDEX IF NOT EXISTS idx_optimization_results_time
+    ON optimization_results ("timestamp" DESC, id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_interventions_created_at
+    ON interventions (created_at, id);
@@ -0,0 +1,22 @@
+-- Top-k indexes for the best-performing endpoints. The CRUD layer filters out
+-- NULL scores and sends ORDER BY ... DESC LIMIT n, so each query can read the
+-- first n entries of one of these partial indexes instead of sorting the table.
+CREATE INDEX IF NOT EXISTS idx_impacts_effectiveness_desc
+    ON intervention_impacts (effectiveness_score DESC)
+    WHERE effectiveness_score IS NOT NULL;
+
+CREATE INDEX IF NOT EXISTS idx_impacts_grid_cell_effectiveness
+    ON intervention_impacts (grid_cell_id, effectiveness_score DESC)
+    WHERE effectiveness_score IS NOT NULL;
+
+CREATE INDEX IF NOT EXISTS idx_optimization_results_best
+    ON optimization_results (objective_value DESC)
+    WHERE status = 'completed' AND objective_value IS NOT NULL;
+
+CREATE INDEX IF NOT EXISTS idx_optimization_results_type_best
+    ON optimization_results (optimization_type, objective_value DESC)
+    WHERE status = 'completed' AND objective_value IS NOT NULL;
+
+CREATE INDEX IF NOT EXISTS idx_optimization_results_grid_cell_best
+    ON optimization_results (grid_cell_id, objective_value DESC)
+    WHERE status = 'completed' AND objective_value IS NOT NULL;
@@ -0,0 +1,34 @@
+-- All impact statistics in one statement, called via PostgREST RPC
+-- (POST /rest/v1/rpc/impact_statistics). Omitted filters default to NULL = no filter.
+CREATE OR REPLACE FUNCTION impact_statistics(
+    intervention_id uuid DEFAULT NULL,
+    grid_cell_id uuid DEFAULT NULL,
+    start_time timestamptz DEFAULT NULL,
+    end_time timestamptz DEFAULT NULL
+)
+RETURNS TABLE (
+    total_impacts bigint,
+    avg_effectiveness double precision,
+    avg_confidence double precision,
+    avg_temperature_change double precision,
+    avg_cost_per_degree double precision,
+    avg_efficiency_ratio double precision,
+    avg_environmental_impact double precision
+)
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT
+        count(*),
+        avg(i.effectiveness_score)::double precision,
+        avg(i.confidence_level)::double precision,
+        avg(i.temperature_change)::double precision,
+        avg(i.cost_per_degree)::double precision,
+        avg(i.efficiency_ratio)::double precision,
+        avg(i.environmental_impact_score)::double precision
+    FROM intervention_impacts i
+    WHERE (impact_statistics.intervention_id IS NULL OR i.intervention_id = impact_statistics.intervention_id)
+      AND (impact_statistics.grid_cell_id IS NULL OR i.grid_cell_id = impact_statistics.grid_cell_id)
+      AND (impact_statistics.start_time IS NULL OR i."timestamp" >= impact_statistics.start_time)
+      AND (impact_statistics.end_time IS NULL OR i."timestamp" <= impact_statistics.end_time);
+$$;
@@ -0,0 +1,10 @@
+-- Satellite data lists page on ("timestamp", id) DESC; these indexes let each
+-- cursor page start with an index seek, optionally after a grid cell or satellite filter.
+CREATE INDEX IF NOT EXISTS idx_satellite_data_time
+    ON satellite_data ("timestamp" DESC, id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_satellite_data_grid_cell_time
+    ON satellite_data (grid_cell_id, "timestamp" DESC, id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_satellite_data_satellite_time
+    ON satellite_data (satellite_id, "timestamp" DESC, id DESC);
@@ -0,0 +1,48 @@
+-- Data source statistics in one statement, called via PostgREST RPC
+-- (POST /rest/v1/rpc/data_source_statistics). The two distributions are
+-- aggregated from the same scan as the counts and averages.
+CREATE OR REPLACE FUNCTION data_source_statistics()
+RETURNS TABLE (
+    total_sources bigint,
+    active_sources bigint,
+    inactive_sources bigint,
+    auth_required bigint,
+    no_auth_required bigint,
+    type_distribution jsonb,
+    provider_distribution jsonb,
+    avg_data_quality double precision,
+    avg_reliability double precision
+)
+LANGUAGE sql
+STABLE
+AS $$
+    WITH totals AS (
+        SELECT
+            count(*) AS total_sources,
+            count(*) FILTER (WHERE d.is_active) AS active_sources,
+            count(*) FILTER (WHERE d.requires_authentication) AS auth_required,
+            avg(d.data_quality_score)::double precision AS avg_data_quality,
+            avg(d.reliability_score)::double precision AS avg_reliability
+        FROM data_sources d
+    )
+    SELECT
+        t.total_sources,
+        t.active_sources,
+        t.total_sources - t.active_sources,
+        t.auth_required,
+        t.total_sources - t.auth_required,
+        COALESCE((
+            SELECT jsonb_object_agg(source_type, n)
+            FROM (SELECT source_type, count(*) AS n FROM data_sources GROUP BY source_type) types
+        ), '{}'::jsonb),
+        COALESCE((
+            SELECT jsonb_object_agg(provider, n)
+            FROM (
+                SELECT provider, count(*) AS n FROM data_sources
+                WHERE provider IS NOT NULL GROUP BY provider
+            ) providers
+        ), '{}'::jsonb),
+        t.avg_data_quality,
+        t.avg_reliability
+    FROM totals t;
+$$;
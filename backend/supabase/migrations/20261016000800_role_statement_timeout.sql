@@ -0,0 +1,9 @@
+-- Cap query time for service_role, the one PostgREST role Supabase leaves
+-- without a statement_timeout, so a runaway query on the service key cannot hold
+-- a pooled connection indefinitely. anon (3s) and authenticated (8s) keep
+-- Supabase's defaults; service_role gets the authenticated cap. The backend's
+-- SUPABASE_TIMEOUT client timeout sits just above the longest of these.
+ALTER ROLE service_role SET statement_timeout = '8s';
+
+-- PostgREST caches role settings; reload them
+NOTIFY pgrst, 'reload config';
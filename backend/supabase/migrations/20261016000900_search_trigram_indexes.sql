@@ -0,0 +1,19 @@
+-- The search endpoints filter with ILIKE '%term%'. A leading wildcard cannot use
+-- a btree, but a pg_trgm GIN index serves ILIKE directly; the OR across columns
+-- becomes a BitmapOr of these indexes. The queries themselves are unchanged.
+CREATE EXTENSION IF NOT EXISTS pg_trgm WITH SCHEMA extensions;
+
+CREATE INDEX IF NOT EXISTS idx_data_sources_name_trgm
+    ON data_sources USING gin (name extensions.gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_data_sources_description_trgm
+    ON data_sources USING gin (description extensions.gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_data_sources_provider_trgm
+    ON data_sources USING gin (provider extensions.gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_interventions_name_trgm
+    ON interventions USING gin (name extensions.gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_interventions_description_trgm
+    ON interventions USING gin (description extensions.gin_trgm_ops);
@@ -0,0 +1,23 @@
+-- Record a fetch outcome for a data source in one atomic UPDATE ... RETURNING.
+-- error_count is incremented server-side, so concurrent failure reports cannot
+-- overwrite each other's increments. Called via PostgREST RPC.
+CREATE OR REPLACE FUNCTION set_data_source_status(
+    data_source_id uuid,
+    is_active boolean,
+    last_error text DEFAULT NULL
+)
+RETURNS SETOF data_sources
+LANGUAGE sql
+AS $$
+    UPDATE data_sources d
+    SET
+        is_active = set_data_source_status.is_active,
+        last_successful_fetch = CASE WHEN set_data_source_status.is_active
+            THEN now() ELSE d.last_successful_fetch END,
+        last_error = CASE WHEN set_data_source_status.is_active
+            THEN NULL ELSE set_data_source_status.last_error END,
+        error_count = CASE WHEN set_data_source_status.is_active
+            THEN d.error_count ELSE COALESCE(d.error_count, 0) + 1 END
+    WHERE d.id = set_data_source_status.data_source_id
+    RETURNING d.*;
+$$;
@@ -0,0 +1,15 @@
+-- get_active_data_sources filters is_active = true and pages on (name, id).
+-- A partial index holds only the active rows, already in page order.
+CREATE INDEX IF NOT EXISTS idx_data_sources_active_name
+    ON data_sources (name, id)
+    WHERE is_active;
+
+-- Intervention lists filter on one of these columns and page on (created_at, id)
+CREATE INDEX IF NOT EXISTS idx_interventions_status_created_at
+    ON interventions (status, created_at, id);
+
+CREATE INDEX IF NOT EXISTS idx_interventions_type_created_at
+    ON interventions (intervention_type, created_at, id);
+
+CREATE INDEX IF NOT EXISTS idx_interventions_operator_created_at
+    ON interventions (operator_id, created_at, id);
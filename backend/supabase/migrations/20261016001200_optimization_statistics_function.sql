@@ -0,0 +1,37 @@
+-- Optimization result statistics in one aggregate statement, called via PostgREST
+-- RPC (POST /rest/v1/rpc/optimization_statistics). Averages divide by the total
+-- row count, as the endpoint always has. Omitted filters default to NULL = no filter.
+CREATE OR REPLACE FUNCTION optimization_statistics(
+    operator_id uuid DEFAULT NULL,
+    grid_cell_id uuid DEFAULT NULL,
+    optimization_type text DEFAULT NULL,
+    algorithm text DEFAULT NULL
+)
+RETURNS TABLE (
+    total_results bigint,
+    completed_results bigint,
+    failed_results bigint,
+    running_results bigint,
+    avg_execution_time double precision,
+    avg_iterations double precision,
+    avg_validation_score double precision,
+    best_objective_value double precision
+)
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT
+        count(*),
+        count(*) FILTER (WHERE o.status = 'completed'),
+        count(*) FILTER (WHERE o.status = 'failed'),
+        count(*) FILTER (WHERE o.status = 'running'),
+        COALESCE(sum(o.execution_time)::double precision / NULLIF(count(*), 0), 0),
+        COALESCE(sum(o.iterations)::double precision / NULLIF(count(*), 0), 0),
+        COALESCE(sum(o.validation_score)::double precision / NULLIF(count(*), 0), 0),
+        max(o.objective_value)::double precision
+    FROM optimization_results o
+    WHERE (optimization_statistics.operator_id IS NULL OR o.operator_id = optimization_statistics.operator_id)
+      AND (optimization_statistics.grid_cell_id IS NULL OR o.grid_cell_id = optimization_statistics.grid_cell_id)
+      AND (optimization_statistics.optimization_type IS NULL OR o.optimization_type = optimization_statistics.optimization_type)
+      AND (optimization_statistics.algorithm IS NULL OR o.algorithm = optimization_statistics.algorithm);
+$$;
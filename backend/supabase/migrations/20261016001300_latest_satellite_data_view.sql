@@ -0,0 +1,9 @@
+-- Most recent reading of every grid cell. DISTINCT ON walks
+-- idx_satellite_data_grid_cell_time once, keeping the first row per cell, so a
+-- dashboard gets all cells in one query instead of one "latest" call per cell.
+-- security_invoker keeps the caller's row-level security in force.
+CREATE OR REPLACE VIEW latest_satellite_data
+WITH (security_invoker = true) AS
+SELECT DISTINCT ON (grid_cell_id) *
+FROM satellite_data
+ORDER BY grid_cell_id, "timestamp" DESC, id DESC;
@@ -0,0 +1,19 @@
+-- Scale amount per intervention type, grouped in Postgres (HashAggregate) so the
+-- API receives one row per type instead of every intervention. Called via
+-- PostgREST RPC, which encodes the result set as a JSON array server-side.
+CREATE OR REPLACE FUNCTION get_capacity_by_intervention_type()
+RETURNS TABLE (
+    intervention_type text,
+    total_scale double precision,
+    count bigint
+)
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT
+        i.intervention_type,
+        COALESCE(sum(i.scale_amount), 0)::double precision,
+        count(*)
+    FROM interventions i
+    GROUP BY i.intervention_type;
+$$;
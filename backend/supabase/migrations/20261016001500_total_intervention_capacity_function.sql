@@ -0,0 +1,8 @@
+-- Total scale across all interventions as one scalar, called via PostgREST RPC.
+CREATE OR REPLACE FUNCTION get_total_intervention_capacity()
+RETURNS double precision
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT COALESCE(sum(scale_amount), 0)::double precision FROM interventions;
+$$;
@@ -0,0 +1,103 @@
+-- Per-type capacity totals kept current by a row trigger on interventions, so
+-- get_capacity_by_intervention_type() reads one row per type instead of
+-- aggregating the whole table. Each write adjusts only the affected type's row,
+-- inside the writing transaction, so readers never see a stale total.
+--
+-- A total covers every row, including rows the caller's row-level security would
+-- hide, so the table lives in the private schema that PostgREST does not expose,
+-- and the capacity functions only read it for roles that bypass RLS anyway
+-- (service_role, which the backend uses). Other roles keep the row aggregate.
+CREATE SCHEMA IF NOT EXISTS private;
+REVOKE ALL ON SCHEMA private FROM PUBLIC, anon, authenticated;
+GRANT USAGE ON SCHEMA private TO service_role;
+
+CREATE TABLE IF NOT EXISTS private.intervention_capacity_by_type (
+    intervention_type text PRIMARY KEY,
+    total_scale numeric NOT NULL DEFAULT 0,
+    count bigint NOT NULL DEFAULT 0
+);
+
+REVOKE ALL ON private.intervention_capacity_by_type FROM PUBLIC, anon, authenticated;
+GRANT SELECT ON private.intervention_capacity_by_type TO service_role;
+
+INSERT INTO private.intervention_capacity_by_type (intervention_type, total_scale, count)
+SELECT intervention_type, COALESCE(sum(scale_amount), 0), count(*)
+FROM interventions
+GROUP BY intervention_type
+ON CONFLICT (intervention_type) DO UPDATE
+SET total_scale = EXCLUDED.total_scale, count = EXCLUDED.count;
+
+CREATE OR REPLACE FUNCTION private.track_intervention_capacity()
+RETURNS trigger
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE private.intervention_capacity_by_type
+        SET total_scale = total_scale - COALESCE(OLD.scale_amount, 0),
+            count = count - 1
+        WHERE intervention_type = OLD.intervention_type;
+
+        DELETE FROM private.intervention_capacity_by_type
+        WHERE intervention_type = OLD.intervention_type AND count <= 0;
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO private.intervention_capacity_by_type AS c (intervention_type, total_scale, count)
+        VALUES (NEW.intervention_type, COALESCE(NEW.scale_amount, 0), 1)
+        ON CONFLICT (intervention_type) DO UPDATE
+        SET total_scale = c.total_scale + EXCLUDED.total_scale,
+            count = c.count + 1;
+    END IF;
+
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS interventions_track_capacity ON interventions;
+CREATE TRIGGER interventions_track_capacity
+    AFTER INSERT OR DELETE OR UPDATE OF intervention_type, scale_amount ON interventions
+    FOR EACH ROW EXECUTE FUNCTION private.track_intervention_capacity();
+
+-- Same result as before: from the totals table when RLS does not apply to the
+-- caller, otherwise grouped from the interventions the caller can see
+CREATE OR REPLACE FUNCTION get_capacity_by_intervention_type()
+RETURNS TABLE (
+    intervention_type text,
+    total_scale double precision,
+    count bigint
+)
+LANGUAGE plpgsql
+STABLE
+AS $$
+BEGIN
+    IF (SELECT r.rolsuper OR r.rolbypassrls FROM pg_roles r WHERE r.rolname = current_user) THEN
+        RETURN QUERY
+        SELECT c.intervention_type, c.total_scale::double precision, c.count
+        FROM private.intervention_capacity_by_type c;
+    ELSE
+        RETURN QUERY
+        SELECT
+            i.intervention_type,
+            COALESCE(sum(i.scale_amount), 0)::double precision,
+            count(*)
+        FROM interventions i
+        GROUP BY i.intervention_type;
+    END IF;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION get_total_intervention_capacity()
+RETURNS double precision
+LANGUAGE plpgsql
+STABLE
+AS $$
+BEGIN
+    IF (SELECT r.rolsuper OR r.rolbypassrls FROM pg_roles r WHERE r.rolname = current_user) THEN
+        RETURN (SELECT COALESCE(sum(c.total_scale), 0)::double precision FROM private.intervention_capacity_by_type c);
+    END IF;
+    RETURN (SELECT COALESCE(sum(i.scale_amount), 0)::double precision FROM interventions i);
+END;
+$$;
@@ -0,0 +1,158 @@
+-- Running per-intervention impact sums, kept current by a row trigger on
+-- intervention_impacts. impact_statistics() reads them when no grid cell or
+-- time window is given, instead of scanning every impact of the intervention.
+-- Sums and non-NULL counts are stored (not running averages) so every average
+-- stays exact and skips NULLs the same way avg() does.
+--
+-- The totals include rows the caller's row-level security may hide, so like
+-- intervention_capacity_by_type they live in the private schema and are only
+-- read for roles that bypass RLS.
+CREATE TABLE IF NOT EXISTS private.intervention_impact_totals (
+    intervention_id uuid PRIMARY KEY,
+    impact_count bigint NOT NULL DEFAULT 0,
+    effectiveness_sum numeric NOT NULL DEFAULT 0,
+    effectiveness_n bigint NOT NULL DEFAULT 0,
+    confidence_sum numeric NOT NULL DEFAULT 0,
+    confidence_n bigint NOT NULL DEFAULT 0,
+    temperature_change_sum numeric NOT NULL DEFAULT 0,
+    temperature_change_n bigint NOT NULL DEFAULT 0,
+    cost_per_degree_sum numeric NOT NULL DEFAULT 0,
+    cost_per_degree_n bigint NOT NULL DEFAULT 0,
+    efficiency_ratio_sum numeric NOT NULL DEFAULT 0,
+    efficiency_ratio_n bigint NOT NULL DEFAULT 0,
+    environmental_impact_sum numeric NOT NULL DEFAULT 0,
+    environmental_impact_n bigint NOT NULL DEFAULT 0,
+    updated_at timestamptz NOT NULL DEFAULT now()
+);
+
+REVOKE ALL ON private.intervention_impact_totals FROM PUBLIC, anon, authenticated;
+GRANT SELECT ON private.intervention_impact_totals TO service_role;
+
+INSERT INTO private.intervention_impact_totals
+SELECT
+    i.intervention_id,
+    count(*),
+    COALESCE(sum(i.effectiveness_score), 0), count(i.effectiveness_score),
+    COALESCE(sum(i.confidence_level), 0), count(i.confidence_level),
+    COALESCE(sum(i.temperature_change), 0), count(i.temperature_change),
+    COALESCE(sum(i.cost_per_degree), 0), count(i.cost_per_degree),
+    COALESCE(sum(i.efficiency_ratio), 0), count(i.efficiency_ratio),
+    COALESCE(sum(i.environmental_impact_score), 0), count(i.environmental_impact_score),
+    now()
+FROM intervention_impacts i
+GROUP BY i.intervention_id
+ON CONFLICT (intervention_id) DO NOTHING;
+
+-- Add (sign = 1) or remove (sign = -1) one impact row's contribution
+CREATE OR REPLACE FUNCTION private.apply_intervention_impact_totals(r intervention_impacts, sign integer)
+RETURNS void
+LANGUAGE sql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+    INSERT INTO private.intervention_impact_totals AS t VALUES (
+        r.intervention_id,
+        sign,
+        COALESCE(r.effectiveness_score, 0) * sign, (r.effectiveness_score IS NOT NULL)::int * sign,
+        COALESCE(r.confidence_level, 0) * sign, (r.confidence_level IS NOT NULL)::int * sign,
+        COALESCE(r.temperature_change, 0) * sign, (r.temperature_change IS NOT NULL)::int * sign,
+        COALESCE(r.cost_per_degree, 0) * sign, (r.cost_per_degree IS NOT NULL)::int * sign,
+        COALESCE(r.efficiency_ratio, 0) * sign, (r.efficiency_ratio IS NOT NULL)::int * sign,
+        COALESCE(r.environmental_impact_score, 0) * sign, (r.environmental_impact_score IS NOT NULL)::int * sign,
+        now()
+    )
+    ON CONFLICT (intervention_id) DO UPDATE SET
+        impact_count = t.impact_count + EXCLUDED.impact_count,
+        effectiveness_sum = t.effectiveness_sum + EXCLUDED.effectiveness_sum,
+        effectiveness_n = t.effectiveness_n + EXCLUDED.effectiveness_n,
+        confidence_sum = t.confidence_sum + EXCLUDED.confidence_sum,
+        confidence_n = t.confidence_n + EXCLUDED.confidence_n,
+        temperature_change_sum = t.temperature_change_sum + EXCLUDED.temperature_change_sum,
+        temperature_change_n = t.temperature_change_n + EXCLUDED.temperature_change_n,
+        cost_per_degree_sum = t.cost_per_degree_sum + EXCLUDED.cost_per_degree_sum,
+        cost_per_degree_n = t.cost_per_degree_n + EXCLUDED.cost_per_degree_n,
+        efficiency_ratio_sum = t.efficiency_ratio_sum + EXCLUDED.efficiency_ratio_sum,
+        efficiency_ratio_n = t.efficiency_ratio_n + EXCLUDED.efficiency_ratio_n,
+        environmental_impact_sum = t.environmental_impact_sum + EXCLUDED.environmental_impact_sum,
+        environmental_impact_n = t.environmental_impact_n + EXCLUDED.environmental_impact_n,
+        updated_at = EXCLUDED.updated_at;
+$$;
+
+CREATE OR REPLACE FUNCTION private.track_intervention_impact_totals()
+RETURNS trigger
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM private.apply_intervention_impact_totals(OLD, -1);
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM private.apply_intervention_impact_totals(NEW, 1);
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS intervention_impacts_track_totals ON intervention_impacts;
+CREATE TRIGGER intervention_impacts_track_totals
+    AFTER INSERT OR UPDATE OR DELETE ON intervention_impacts
+    FOR EACH ROW EXECUTE FUNCTION private.track_intervention_impact_totals();
+
+-- Same signature and result as before; unfiltered and per-intervention calls
+-- come from the totals table when RLS does not apply to the caller. Grid cell /
+-- time filters, and callers subject to RLS, still aggregate the visible rows.
+CREATE OR REPLACE FUNCTION impact_statistics(
+    intervention_id uuid DEFAULT NULL,
+    grid_cell_id uuid DEFAULT NULL,
+    start_time timestamptz DEFAULT NULL,
+    end_time timestamptz DEFAULT NULL
+)
+RETURNS TABLE (
+    total_impacts bigint,
+    avg_effectiveness double precision,
+    avg_confidence double precision,
+    avg_temperature_change double precision,
+    avg_cost_per_degree double precision,
+    avg_efficiency_ratio double precision,
+    avg_environmental_impact double precision
+)
+LANGUAGE plpgsql
+STABLE
+AS $$
+BEGIN
+    IF impact_statistics.grid_cell_id IS NULL
+       AND impact_statistics.start_time IS NULL
+       AND impact_statistics.end_time IS NULL
+       AND (SELECT r.rolsuper OR r.rolbypassrls FROM pg_roles r WHERE r.rolname = current_user) THEN
+        RETURN QUERY
+        SELECT
+            COALESCE(sum(t.impact_count), 0)::bigint,
+            (sum(t.effectiveness_sum) / NULLIF(sum(t.effectiveness_n), 0))::double precision,
+            (sum(t.confidence_sum) / NULLIF(sum(t.confidence_n), 0))::double precision,
+            (sum(t.temperature_change_sum) / NULLIF(sum(t.temperature_change_n), 0))::double precision,
+            (sum(t.cost_per_degree_sum) / NULLIF(sum(t.cost_per_degree_n), 0))::double precision,
+            (sum(t.efficiency_ratio_sum) / NULLIF(sum(t.efficiency_ratio_n), 0))::double precision,
+            (sum(t.environmental_impact_sum) / NULLIF(sum(t.environmental_impact_n), 0))::double precision
+        FROM private.intervention_impact_totals t
+        WHERE impact_statistics.intervention_id IS NULL
+           OR t.intervention_id = impact_statistics.intervention_id;
+    ELSE
+        RETURN QUERY
+        SELECT
+            count(*),
+            avg(i.effectiveness_score)::double precision,
+            avg(i.confidence_level)::double precision,
+            avg(i.temperature_change)::double precision,
+            avg(i.cost_per_degree)::double precision,
+            avg(i.efficiency_ratio)::double precision,
+            avg(i.environmental_impact_score)::double precision
+        FROM intervention_impacts i
+        WHERE (impact_statistics.intervention_id IS NULL OR i.intervention_id = impact_statistics.intervention_id)
+          AND (impact_statistics.grid_cell_id IS NULL OR i.grid_cell_id = impact_statistics.grid_cell_id)
+          AND (impact_statistics.start_time IS NULL OR i."timestamp" >= impact_statistics.start_time)
+          AND (impact_statistics.end_time IS NULL OR i."timestamp" <= impact_statistics.end_time);
+    END IF;
+END;
+$$;
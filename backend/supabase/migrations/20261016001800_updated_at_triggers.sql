@@ -0,0 +1,37 @@
+-- Stamp updated_at in the database on every UPDATE, whoever issues it, so the
+-- API no longer sends a client clock value and the weak ETags built from
+-- updated_at change on every write, including satellite and data source rows.
+CREATE OR REPLACE FUNCTION set_updated_at()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    NEW.updated_at = now();
+    RETURN NEW;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS interventions_set_updated_at ON interventions;
+CREATE TRIGGER interventions_set_updated_at
+    BEFORE UPDATE ON interventions
+    FOR EACH ROW EXECUTE FUNCTION set_updated_at();
+
+DROP TRIGGER IF EXISTS intervention_impacts_set_updated_at ON intervention_impacts;
+CREATE TRIGGER intervention_impacts_set_updated_at
+    BEFORE UPDATE ON intervention_impacts
+    FOR EACH ROW EXECUTE FUNCTION set_updated_at();
+
+DROP TRIGGER IF EXISTS optimization_results_set_updated_at ON optimization_results;
+CREATE TRIGGER optimization_results_set_updated_at
+    BEFORE UPDATE ON optimization_results
+    FOR EACH ROW EXECUTE FUNCTION set_updated_at();
+
+DROP TRIGGER IF EXISTS satellite_data_set_updated_at ON satellite_data;
+CREATE TRIGGER satellite_data_set_updated_at
+    BEFORE UPDATE ON satellite_data
+    FOR EACH ROW EXECUTE FUNCTION set_updated_at();
+
+DROP TRIGGER IF EXISTS data_sources_set_updated_at ON data_sources;
+CREATE TRIGGER data_sources_set_updated_at
+    BEFORE UPDATE ON data_sources
+    FOR EACH ROW EXECUTE FUNCTION set_updated_at();
@@ -0,0 +1,36 @@
+-- Satellite data statistics in one aggregate statement, called via PostgREST RPC
+-- (POST /rest/v1/rpc/satellite_data_statistics) instead of paging every matching
+-- reading into the API. avg() skips NULL readings, as the endpoint always has.
+-- Omitted filters default to NULL = no filter.
+CREATE OR REPLACE FUNCTION satellite_data_statistics(
+    grid_cell_id uuid DEFAULT NULL,
+    satellite_id text DEFAULT NULL,
+    start_time timestamptz DEFAULT NULL,
+    end_time timestamptz DEFAULT NULL
+)
+RETURNS TABLE (
+    total_records bigint,
+    avg_temperature double precision,
+    avg_humidity double precision,
+    avg_pressure double precision,
+    avg_co2 double precision,
+    avg_aod double precision,
+    data_quality_avg double precision
+)
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT
+        count(*),
+        avg(s.temperature)::double precision,
+        avg(s.humidity)::double precision,
+        avg(s.pressure)::double precision,
+        avg(s.co2_concentration)::double precision,
+        avg(s.aerosol_optical_depth)::double precision,
+        avg(s.data_quality)::double precision
+    FROM satellite_data s
+    WHERE (satellite_data_statistics.grid_cell_id IS NULL OR s.grid_cell_id = satellite_data_statistics.grid_cell_id)
+      AND (satellite_data_statistics.satellite_id IS NULL OR s.satellite_id = satellite_data_statistics.satellite_id)
+      AND (satellite_data_statistics.start_time IS NULL OR s."timestamp" >= satellite_data_statistics.start_time)
+      AND (satellite_data_statistics.end_time IS NULL OR s."timestamp" <= satellite_data_statistics.end_time);
+$$;
@@ -0,0 +1,17 @@
+-- Impact lists page on ("timestamp", id) DESC, or (effectiveness_score, id) DESC
+-- for the effectiveness range. The earlier filter indexes stop at the sort column,
+-- so a cursor page re-checked ties on id; these carry id as well and replace them.
+CREATE INDEX IF NOT EXISTS idx_impacts_time
+    ON intervention_impacts ("timestamp" DESC, id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_impacts_intervention_time_id
+    ON intervention_impacts (intervention_id, "timestamp" DESC, id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_impacts_grid_cell_time_id
+    ON intervention_impacts (grid_cell_id, "timestamp" DESC, id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_impacts_effectiveness_id
+    ON intervention_impacts (effectiveness_score DESC, id DESC);
+
+DROP INDEX IF EXISTS idx_impacts_intervention_time;
+DROP INDEX IF EXISTS idx_impacts_grid_cell_time;
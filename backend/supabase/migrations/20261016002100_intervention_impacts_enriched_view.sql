@@ -0,0 +1,14 @@
+-- Impacts with the fields of their intervention that dashboards render next to
+-- them (name, type, location), so a page of impacts needs no follow-up call per
+-- intervention. Grid cells have no table yet; the intervention's coordinates
+-- locate the impact. security_invoker keeps the caller's row-level security in force.
+CREATE OR REPLACE VIEW intervention_impacts_enriched
+WITH (security_invoker = true) AS
+SELECT
+    ii.*,
+    i.name AS intervention_name,
+    i.intervention_type,
+    i.latitude,
+    i.longitude
+FROM intervention_impacts ii
+JOIN interventions i ON i.id = ii.intervention_id;
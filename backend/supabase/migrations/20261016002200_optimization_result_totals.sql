@@ -0,0 +1,180 @@
+-- Running optimization result counts and sums per (operator, grid cell, type,
+-- algorithm), kept current by a row trigger on optimization_results.
+-- optimization_statistics() filters on exactly these columns, so every call now
+-- sums a handful of group rows instead of scanning the matching results.
+-- Sums are stored rather than averages so the "divide by total rows" averages
+-- the endpoint has always returned stay exact.
+--
+-- The totals include rows the caller's row-level security may hide, so like the
+-- other totals tables they live in the private schema and are only read for
+-- roles that bypass RLS.
+CREATE TABLE IF NOT EXISTS private.optimization_result_totals (
+    operator_id uuid,
+    grid_cell_id uuid,
+    optimization_type text,
+    algorithm text,
+    result_count bigint NOT NULL DEFAULT 0,
+    completed_count bigint NOT NULL DEFAULT 0,
+    failed_count bigint NOT NULL DEFAULT 0,
+    running_count bigint NOT NULL DEFAULT 0,
+    execution_time_sum numeric NOT NULL DEFAULT 0,
+    iterations_sum numeric NOT NULL DEFAULT 0,
+    validation_score_sum numeric NOT NULL DEFAULT 0,
+    best_objective_value double precision,
+    updated_at timestamptz NOT NULL DEFAULT now(),
+    UNIQUE NULLS NOT DISTINCT (operator_id, grid_cell_id, optimization_type, algorithm)
+);
+
+REVOKE ALL ON private.optimization_result_totals FROM PUBLIC, anon, authenticated;
+GRANT SELECT ON private.optimization_result_totals TO service_role;
+
+INSERT INTO private.optimization_result_totals
+SELECT
+    o.operator_id,
+    o.grid_cell_id,
+    o.optimization_type,
+    o.algorithm,
+    count(*),
+    count(*) FILTER (WHERE o.status = 'completed'),
+    count(*) FILTER (WHERE o.status = 'failed'),
+    count(*) FILTER (WHERE o.status = 'running'),
+    COALESCE(sum(o.execution_time), 0),
+    COALESCE(sum(o.iterations), 0),
+    COALESCE(sum(o.validation_score), 0),
+    max(o.objective_value)::double precision,
+    now()
+FROM optimization_results o
+GROUP BY o.operator_id, o.grid_cell_id, o.optimization_type, o.algorithm
+ON CONFLICT (operator_id, grid_cell_id, optimization_type, algorithm) DO NOTHING;
+
+-- Add (sign = 1) or remove (sign = -1) one result's contribution. A maximum
+-- cannot be subtracted, so removals leave best_objective_value to the trigger.
+CREATE OR REPLACE FUNCTION private.apply_optimization_result_totals(r optimization_results, sign integer)
+RETURNS void
+LANGUAGE sql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+    INSERT INTO private.optimization_result_totals AS t VALUES (
+        r.operator_id,
+        r.grid_cell_id,
+        r.optimization_type,
+        r.algorithm,
+        sign,
+        (r.status IS NOT DISTINCT FROM 'completed')::int * sign,
+        (r.status IS NOT DISTINCT FROM 'failed')::int * sign,
+        (r.status IS NOT DISTINCT FROM 'running')::int * sign,
+        COALESCE(r.execution_time, 0) * sign,
+        COALESCE(r.iterations, 0) * sign,
+        COALESCE(r.validation_score, 0) * sign,
+        CASE WHEN sign > 0 THEN r.objective_value::double precision END,
+        now()
+    )
+    ON CONFLICT (operator_id, grid_cell_id, optimization_type, algorithm) DO UPDATE SET
+        result_count = t.result_count + EXCLUDED.result_count,
+        completed_count = t.completed_count + EXCLUDED.completed_count,
+        failed_count = t.failed_count + EXCLUDED.failed_count,
+        running_count = t.running_count + EXCLUDED.running_count,
+        execution_time_sum = t.execution_time_sum + EXCLUDED.execution_time_sum,
+        iterations_sum = t.iterations_sum + EXCLUDED.iterations_sum,
+        validation_score_sum = t.validation_score_sum + EXCLUDED.validation_score_sum,
+        best_objective_value = GREATEST(t.best_objective_value, EXCLUDED.best_objective_value),
+        updated_at = EXCLUDED.updated_at;
+$$;
+
+-- SECURITY DEFINER so the best-value rescan sees every row of the group, not
+-- only those the caller's row-level security exposes
+CREATE OR REPLACE FUNCTION private.track_optimization_result_totals()
+RETURNS trigger
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM private.apply_optimization_result_totals(OLD, -1);
+        -- Only removing the group's current best forces a rescan of that group
+        UPDATE private.optimization_result_totals t
+        SET best_objective_value = (
+            SELECT max(o.objective_value)::double precision
+            FROM optimization_results o
+            WHERE o.operator_id IS NOT DISTINCT FROM OLD.operator_id
+              AND o.grid_cell_id IS NOT DISTINCT FROM OLD.grid_cell_id
+              AND o.optimization_type IS NOT DISTINCT FROM OLD.optimization_type
+              AND o.algorithm IS NOT DISTINCT FROM OLD.algorithm
+        )
+        WHERE t.operator_id IS NOT DISTINCT FROM OLD.operator_id
+          AND t.grid_cell_id IS NOT DISTINCT FROM OLD.grid_cell_id
+          AND t.optimization_type IS NOT DISTINCT FROM OLD.optimization_type
+          AND t.algorithm IS NOT DISTINCT FROM OLD.algorithm
+          AND t.best_objective_value = OLD.objective_value::double precision;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM private.apply_optimization_result_totals(NEW, 1);
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS optimization_results_track_totals ON optimization_results;
+CREATE TRIGGER optimization_results_track_totals
+    AFTER INSERT OR UPDATE OR DELETE ON optimization_results
+    FOR EACH ROW EXECUTE FUNCTION private.track_optimization_result_totals();
+
+-- Same signature and result as before: summed from the totals table when RLS
+-- does not apply to the caller, otherwise aggregated from the rows it can see
+CREATE OR REPLACE FUNCTION optimization_statistics(
+    operator_id uuid DEFAULT NULL,
+    grid_cell_id uuid DEFAULT NULL,
+    optimization_type text DEFAULT NULL,
+    algorithm text DEFAULT NULL
+)
+RETURNS TABLE (
+    total_results bigint,
+    completed_results bigint,
+    failed_results bigint,
+    running_results bigint,
+    avg_execution_time double precision,
+    avg_iterations double precision,
+    avg_validation_score double precision,
+    best_objective_value double precision
+)
+LANGUAGE plpgsql
+STABLE
+AS $$
+BEGIN
+    IF (SELECT r.rolsuper OR r.rolbypassrls FROM pg_roles r WHERE r.rolname = current_user) THEN
+        RETURN QUERY
+        SELECT
+            COALESCE(sum(t.result_count), 0)::bigint,
+            COALESCE(sum(t.completed_count), 0)::bigint,
+            COALESCE(sum(t.failed_count), 0)::bigint,
+            COALESCE(sum(t.running_count), 0)::bigint,
+            COALESCE(sum(t.execution_time_sum) / NULLIF(sum(t.result_count), 0), 0)::double precision,
+            COALESCE(sum(t.iterations_sum) / NULLIF(sum(t.result_count), 0), 0)::double precision,
+            COALESCE(sum(t.validation_score_sum) / NULLIF(sum(t.result_count), 0), 0)::double precision,
+            max(t.best_objective_value)
+        FROM private.optimization_result_totals t
+        WHERE (optimization_statistics.operator_id IS NULL OR t.operator_id = optimization_statistics.operator_id)
+          AND (optimization_statistics.grid_cell_id IS NULL OR t.grid_cell_id = optimization_statistics.grid_cell_id)
+          AND (optimization_statistics.optimization_type IS NULL OR t.optimization_type = optimization_statistics.optimization_type)
+          AND (optimization_statistics.algorithm IS NULL OR t.algorithm = optimization_statistics.algorithm);
+    ELSE
+        RETURN QUERY
+        SELECT
+            count(*),
+            count(*) FILTER (WHERE o.status = 'completed'),
+            count(*) FILTER (WHERE o.status = 'failed'),
+            count(*) FILTER (WHERE o.status = 'running'),
+            COALESCE(sum(o.execution_time)::double precision / NULLIF(count(*), 0), 0),
+            COALESCE(sum(o.iterations)::double precision / NULLIF(count(*), 0), 0),
+            COALESCE(sum(o.validation_score)::double precision / NULLIF(count(*), 0), 0),
+            max(o.objective_value)::double precision
+        FROM optimization_results o
+        WHERE (optimization_statistics.operator_id IS NULL OR o.operator_id = optimization_statistics.operator_id)
+          AND (optimization_statistics.grid_cell_id IS NULL OR o.grid_cell_id = optimization_statistics.grid_cell_id)
+          AND (optimization_statistics.optimization_type IS NULL OR o.optimization_type = optimization_statistics.optimization_type)
+          AND (optimization_statistics.algorithm IS NULL OR o.algorithm = optimization_statistics.algorithm);
+    END IF;
+END;
+$$;
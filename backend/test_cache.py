@@ -0,0 +1,93 @@
+"""
+Tests for the in-process ttl_cache in app/core/cache.py
+Run with: python -m pytest test_cache.py
+"""
+
+import asyncio
+
+from app.core.cache import ttl_cache
+
+
+def test_pop_during_fill_discards_the_stale_result():
+    rows = {"a": "before"}
+    started, release = asyncio.Event(), asyncio.Event()
+
+    @ttl_cache(ttl=60)
+    async def get_row(id):
+        value = rows[id]
+        started.set()
+        await release.wait()
+        return value
+
+    async def scenario():
+        stale_read = asyncio.ensure_future(get_row("a"))
+        await started.wait()
+        # A write lands while the read is still in flight
+        rows["a"] = "after"
+        get_row.cache_pop("a")
+        release.set()
+        assert await stale_read == "before"
+        assert await get_row("a") == "after"
+
+    asyncio.run(scenario())
+
+
+def test_error_results_are_not_cached():
+    results = [{"error": "upstream"}, {"id": "a"}]
+
+    @ttl_cache(ttl=60)
+    def get_row(id):
+        return results.pop(0)
+
+    assert get_row("a") == {"error": "upstream"}
+    assert get_row("a") == {"id": "a"}
+    assert get_row("a") == {"id": "a"}
+
+
+def test_concurrent_misses_share_one_call():
+    calls = []
+    release = asyncio.Event()
+
+    @ttl_cache(ttl=60)
+    async def get_row(id):
+        calls.append(id)
+        await release.wait()
+        return {"id": id}
+
+    async def scenario():
+        readers = [asyncio.ensure_future(get_row("a")) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*readers)
+        assert all(r == {"id": "a"} for r in results)
+        assert await get_row("a") == {"id": "a"}
+
+    asyncio.run(scenario())
+    assert calls == ["a"]
+
+
+def test_cache_pop_forces_a_fresh_call():
+    calls = []
+
+    @ttl_cache(ttl=60)
+    def get_row(id):
+        calls.append(id)
+        return {"id": id, "n": len(calls)}
+
+    assert get_row("a") == get_row("a") == {"id": "a", "n": 1}
+    get_row.cache_pop("b")  # popping an uncached key is a no-op
+    get_row.cache_pop("a")
+    assert get_row("a") == {"id": "a", "n": 2}
+    assert calls == ["a", "a"]
+
+
+def test_none_is_not_cached():
+    results = [None, {"id": "a"}]
+
+    @ttl_cache(ttl=60)
+    def get_row(id):
+        return results.pop(0)
+
+    assert get_row("a") is None
+    assert get_row("a") == {"id": "a"}
+    assert get_row("a") == {"id": "a"}
@@ -0,0 +1,44 @@
+"""
+Tests for the shared endpoint helpers in app/api/deps.py
+Run with: python -m pytest test_deps.py
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.deps import MAX_BULK_ROWS, check_bulk_size, weak_etag
+
+
+def test_weak_etag_matches_for_string_and_datetime():
+    updated_at = datetime(2026, 10, 16, 12, 30, 0, 123456, tzinfo=timezone.utc)
+    assert weak_etag("a", "2026-10-16T12:30:00.123456+00:00") == weak_etag("a", updated_at)
+    # The same instant written in another offset is the same row version
+    assert weak_etag("a", "2026-10-16T14:30:00.123456+02:00") == weak_etag("a", updated_at)
+
+
+def test_weak_etag_changes_with_version_and_id():
+    updated_at = datetime(2026, 10, 16, tzinfo=timezone.utc)
+    tag = weak_etag("a", updated_at)
+    assert tag.startswith('W/"a-')
+    assert weak_etag("a", updated_at + timedelta(microseconds=1)) != tag
+    assert weak_etag("b", updated_at) != tag
+
+
+def test_check_bulk_size_accepts_up_to_the_limit():
+    check_bulk_size([{}], "rows")
+    check_bulk_size([{}] * MAX_BULK_ROWS, "rows")
+    check_bulk_size([{}] * 3, "rows", max_rows=3)
+
+
+@pytest.mark.parametrize("rows, max_rows, detail", [
+    ([], MAX_BULK_ROWS, "No rows provided"),
+    ([{}] * (MAX_BULK_ROWS + 1), MAX_BULK_ROWS, f"At most {MAX_BULK_ROWS} rows per request"),
+    ([{}] * 4, 3, "At most 3 rows per request"),
+])
+def test_check_bulk_size_rejects_empty_and_oversized(rows, max_rows, detail):
+    with pytest.raises(HTTPException) as e:
+        check_bulk_size(rows, "rows", max_rows=max_rows)
+    assert e.value.status_code == 400
+    assert e.value.detail == detail
@@ -0,0 +1,121 @@
+"""
+Tests for the keyset pagination helpers in app/core/pagination.py
+Run with: python -m pytest test_pagination.py
+"""
+
+import re
+
+import pytest
+
+from app.core.pagination import decode_cursor, encode_cursor, keyset_filter, next_cursor, paginate, quote_value
+
+QUOTED = r'"((?:[^"\\]|\\.)*)"'
+KEYSET = re.compile(rf'(\w+)\.(lt|gt)\.{QUOTED},and\(\1\.eq\.{QUOTED},id\.(lt|gt)\.{QUOTED}\)$')
+
+
+def _unquote(value):
+    return re.sub(r'\\(.)', r'\1', value)
+
+
+class Params:
+    """Just enough of httpx.QueryParams: add() returns a new multi-valued copy"""
+
+    def __init__(self, items=()):
+        self.items = list(items)
+
+    def add(self, key, value):
+        return Params(self.items + [(key, value)])
+
+    def get_list(self, key):
+        return [v for k, v in self.items if k == key]
+
+
+class FakeQuery:
+    """In-memory stand-in for a PostgREST builder that honours a single order parameter"""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.params = Params()
+        self.after = None
+
+    def or_(self, expression):
+        column, op, value, tied_value, id_op, id = KEYSET.match(expression).groups()
+        assert op == id_op and value == tied_value
+        self.after = (column, op, _unquote(value), _unquote(id))
+        return self
+
+    def range(self, start, end):
+        self.start, self.end = start, end
+        return self
+
+    def execute(self):
+        orders = self.params.get_list("order")
+        assert len(orders) == 1, "PostgREST applies only one order parameter"
+        terms = [term.split(".") for term in orders[0].split(",")]
+        desc = terms[0][1] == "desc"
+        assert all(direction == terms[0][1] for _, direction in terms)
+        key = lambda row: tuple(str(row[column]) for column, _ in terms)
+
+        rows = self.rows
+        if self.after:
+            column, op, value, id = self.after
+            bound = (value, id)
+            rows = [r for r in rows if ((str(r[column]), r["id"]) < bound if op == "lt" else (str(r[column]), r["id"]) > bound)]
+        return sorted(rows, key=key, reverse=desc)[self.start:self.end + 1]
+
+
+def test_paginate_sends_one_order_parameter():
+    query = paginate(FakeQuery([]), "timestamp", 0, 10, None, desc=True)
+    assert query.params.get_list("order") == ["timestamp.desc,id.desc"]
+
+
+@pytest.mark.parametrize("desc", [False, True])
+def test_cursor_pages_cover_tied_sort_values_exactly_once(desc):
+    # A bulk insert gives many rows the same timestamp
+    rows = [
+        {"id": f"{i:08d}-0000-0000-0000-000000000000", "timestamp": f"2026-10-16T00:00:0{i // 4}"}
+        for i in range(10)
+    ]
+    seen, after = [], None
+    while True:
+        page = paginate(FakeQuery(rows), "timestamp", 0, 3, after, desc=desc).execute()
+        seen.extend(r["id"] for r in page)
+        cursor = next_cursor(page, "timestamp", 3)
+        if cursor is None:
+            break
+        after = decode_cursor(cursor)
+    assert sorted(seen) == sorted(r["id"] for r in rows)
+    assert len(seen) == len(set(seen))
+
+
+def test_cursor_round_trips_sort_value_and_id():
+    cursor = encode_cursor("2026-10-16T00:00:00+00:00", "abc")
+    assert decode_cursor(cursor) == ("2026-10-16T00:00:00+00:00", "abc")
+    assert decode_cursor(encode_cursor(42, 7)) == (42, "7")
+
+
+@pytest.mark.parametrize("cursor", ["", "not base64!", "bm90IGpzb24=", "WzFd", "WzEsMiwzXQ==", "MTIz"])
+def test_decode_cursor_rejects_malformed_input(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+
+def test_next_cursor_only_for_full_pages():
+    rows = [{"id": "a", "name": "x"}, {"id": "b", "name": "y"}]
+    assert next_cursor([], "name", 2) is None
+    assert next_cursor(rows[:1], "name", 2) is None
+    assert decode_cursor(next_cursor(rows, "name", 2)) == ("y", "b")
+
+
+def test_quote_value_escapes_quotes_and_backslashes():
+    assert quote_value("a,b.c(d)") == '"a,b.c(d)"'
+    assert quote_value('say "hi"') == '"say \\"hi\\""'
+    assert quote_value("C:\\tmp") == '"C:\\\\tmp"'
+
+
+def test_keyset_filter_quotes_values_with_postgrest_delimiters():
+    after = ('Smith, J. (ed.)', "b-1")
+    assert keyset_filter("name", after) == (
+        'name.gt."Smith, J. (ed.)",and(name.eq."Smith, J. (ed.)",id.gt."b-1")'
+    )
+    assert keyset_filter("name", after, desc=True).startswith('name.lt."Smith, J. (ed.)",')